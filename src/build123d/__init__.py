@@ -50,6 +50,7 @@ __all__ = [
     "PolarLocations",
     "Locations",
     "GridLocations",
+    "ObjectCache",
     "BuildLine",
     "Bezier",
     "CenterArc",
@@ -115,12 +116,14 @@ __all__ = [
     "Plane",
     "Compound",
     "Location",
+    "LocationArray",
     "Joint",
     "RigidJoint",
     "RevoluteJoint",
     "LinearJoint",
     "CylindricalJoint",
     "BallJoint",
+    "TessellationCache",
     # Importer functions
     "import_brep",
     "import_step",
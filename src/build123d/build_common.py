@@ -28,16 +28,26 @@ license:
 from __future__ import annotations
 
 import contextvars
+import copy
 import inspect
 import logging
 import warnings
 from abc import ABC, abstractmethod
-from itertools import product
+from collections import OrderedDict
 from math import sqrt
-from typing import Iterable, Union
+from typing import Iterable, Optional, Union
+
+import numpy as np
 
 from build123d.build_enums import Align, Mode, Select
-from build123d.geometry import Axis, Location, Plane, Vector, VectorLike
+from build123d.geometry import (
+    Axis,
+    Location,
+    LocationArray,
+    Plane,
+    Vector,
+    VectorLike,
+)
 from build123d.topology import (
     Compound,
     Edge,
@@ -99,10 +109,8 @@ class Builder(ABC):
         self._reset_tok = None
         self._python_frame = inspect.currentframe().f_back.f_back
         self.builder_parent = None
-        self.last_vertices: ShapeList[Vertex] = ShapeList()
-        self.last_edges: ShapeList[Edge] = ShapeList()
-        self.last_faces: ShapeList[Face] = ShapeList()
-        self.last_solids: ShapeList[Solid] = ShapeList()
+        self._last_operation: tuple[Optional[Shape], Optional[Shape]] = (None, None)
+        self._last_objects: dict[str, ShapeList] = {}
         self.workplanes_context = None
         self.exit_workplanes = None
 
@@ -178,10 +186,80 @@ class Builder(ABC):
         """Name of object to pass to parent"""
         raise NotImplementedError  # pragma: no cover
 
+    @property
+    def last_vertices(self) -> ShapeList[Vertex]:
+        """Vertices changed by the last operation"""
+        return self._get_last("vertices")
+
+    @last_vertices.setter
+    def last_vertices(self, value: Iterable[Vertex]):
+        self._last_objects["vertices"] = ShapeList(value)
+
+    @property
+    def last_edges(self) -> ShapeList[Edge]:
+        """Edges changed by the last operation"""
+        return self._get_last("edges")
+
+    @last_edges.setter
+    def last_edges(self, value: Iterable[Edge]):
+        self._last_objects["edges"] = ShapeList(value)
+
+    @property
+    def last_faces(self) -> ShapeList[Face]:
+        """Faces changed by the last operation"""
+        return self._get_last("faces")
+
+    @last_faces.setter
+    def last_faces(self, value: Iterable[Face]):
+        self._last_objects["faces"] = ShapeList(value)
+
+    @property
+    def last_solids(self) -> ShapeList[Solid]:
+        """Solids changed by the last operation"""
+        return self._get_last("solids")
+
+    @last_solids.setter
+    def last_solids(self, value: Iterable[Solid]):
+        self._last_objects["solids"] = ShapeList(value)
+
+    def _record_operation(self, before: Shape, after: Shape):
+        """Record the builder's object before and after an operation
+
+        The objects changed by the operation are only found if one of the last_*
+        properties is used, which avoids exploring the (potentially large) object
+        after every operation.
+
+        Args:
+            before (Shape): object prior to the operation, may be None
+            after (Shape): object resulting from the operation, may be None
+        """
+        self._last_operation = (before, after)
+        self._last_objects = {}
+
+    def _get_last(self, name: str) -> ShapeList:
+        """Return the objects of the given type changed by the last operation
+
+        Args:
+            name (str): name of the Shape method that returns the objects, e.g. "faces"
+
+        Returns:
+            ShapeList: objects in the result of the last operation that weren't in its
+                source
+        """
+        if name not in self._last_objects:
+            before, after = self._last_operation
+            if after is None or after is before:
+                self._last_objects[name] = ShapeList()
+            else:
+                pre = set() if before is None else set(getattr(before, name)())
+                post = set(getattr(after, name)())
+                self._last_objects[name] = ShapeList(post - pre)
+        return self._last_objects[name]
+
     @property
     def max_dimension(self) -> float:
         """Maximum size of object in all directions"""
-        return self._obj.bounding_box().diagonal if self._obj else 0.0
+        return self._obj.bounding_box(optimal=False).diagonal if self._obj else 0.0
 
     @abstractmethod
     def _add_to_context(
@@ -345,7 +423,8 @@ class LocationList:
     active workplanes.
 
     Args:
-        locations (list[Location]): list of locations to add to the context
+        locations (Union[Iterable[Location], LocationArray]): locations to add to
+            the context
 
     """
 
@@ -357,18 +436,31 @@ class LocationList:
     @property
     def locations(self) -> list[Location]:
         """Current local locations globalized with current workplanes"""
-        global_locations = [
-            plane.to_location() * local_location
-            for plane in WorkplaneList._get_context().workplanes
-            for local_location in self.local_locations
-        ]
-        return global_locations
+        return list(self.location_array)
+
+    @property
+    def location_array(self) -> LocationArray:
+        """Current local locations globalized with current workplanes as an array"""
+        workplanes = LocationArray(
+            plane.to_location() for plane in WorkplaneList._get_context().workplanes
+        )
+        return workplanes.outer(self.local_location_array)
 
-    def __init__(self, locations: list[Location]):
+    @property
+    def local_locations(self) -> list[Location]:
+        """Local locations of this context"""
+        return list(self.local_location_array)
+
+    @local_locations.setter
+    def local_locations(self, locations: Union[Iterable[Location], LocationArray]):
+        self.local_location_array = LocationArray(locations)
+
+    def __init__(self, locations: Union[Iterable[Location], LocationArray]):
         self._reset_tok = None
-        self.local_locations = locations
+        self.local_location_array = LocationArray(locations)
         self.location_index = 0
         self.plane_index = 0
+        self._iter_locations = LocationArray()
 
     def __enter__(self):
         """Upon entering create a token to restore contextvars"""
@@ -377,8 +469,8 @@ class LocationList:
         logger.info(
             "%s is pushing %d points: %s",
             type(self).__name__,
-            len(self.local_locations),
-            self.local_locations,
+            len(self.local_location_array),
+            self.local_location_array,
         )
         return self
 
@@ -386,19 +478,22 @@ class LocationList:
         """Upon exiting restore context"""
         self._current.reset(self._reset_tok)
         logger.info(
-            "%s is popping %d points", type(self).__name__, len(self.local_locations)
+            "%s is popping %d points",
+            type(self).__name__,
+            len(self.local_location_array),
         )
 
     def __iter__(self):
         """Initialize to beginning"""
         self.location_index = 0
+        self._iter_locations = self.location_array
         return self
 
     def __next__(self):
         """While not through all the locations, return the next one"""
-        if self.location_index >= len(self.locations):
+        if self.location_index >= len(self._iter_locations):
             raise StopIteration
-        result = self.locations[self.location_index]
+        result = self._iter_locations[self.location_index]
         self.location_index += 1
         return result
 
@@ -445,26 +540,19 @@ class HexLocations(LocationList):
         self.y_count = y_count
         self.align = align
 
-        # Generate the raw coordinates relative to bottom left point
-        points = ShapeList[Vector]()
-        for x_val in range(0, x_count, 2):
-            for y_val in range(y_count):
-                points.append(
-                    Vector(x_spacing * x_val, y_spacing * y_val + y_spacing / 2)
-                )
-        for x_val in range(1, x_count, 2):
-            for y_val in range(y_count):
-                points.append(Vector(x_spacing * x_val, y_spacing * y_val + y_spacing))
+        # Generate the raw coordinates relative to bottom left point, even columns
+        # first then the odd columns which are shifted up by half a hexagon
+        x_vals = np.concatenate(
+            [np.arange(0, x_count, 2), np.arange(1, x_count, 2)]
+        ).repeat(y_count)
+        y_vals = np.tile(np.arange(y_count), x_count)
+        points = np.zeros((x_count * y_count, 3))
+        points[:, 0] = x_spacing * x_vals
+        points[:, 1] = y_spacing * y_vals + y_spacing * (1 + x_vals % 2) / 2
 
         # Determine the minimum point and size of the array
-        sorted_points = [points.sort_by(Axis.X), points.sort_by(Axis.Y)]
-        # pylint doesn't recognize that a ShapeList of Vector is valid
-        # pylint: disable=no-member
-        size = [
-            sorted_points[0][-1].X - sorted_points[0][0].X,
-            sorted_points[1][-1].Y - sorted_points[1][0].Y,
-        ]
-        min_corner = Vector(sorted_points[0][0].X, sorted_points[1][0].Y)
+        min_corner = points.min(axis=0)
+        size = points.max(axis=0) - min_corner
 
         # Calculate the amount to offset the array to align it
         align_offset = []
@@ -477,16 +565,12 @@ class HexLocations(LocationList):
                 align_offset.append(-size[i])
 
         # Align the points
-        points = ShapeList(
-            [point + Vector(*align_offset) - min_corner for point in points]
-        )
+        points[:, :2] += np.array(align_offset) - min_corner[:2]
 
         # Convert to locations and store the reference plane
-        local_locations = [Location(point) for point in points]
-
-        self.local_locations = Locations._move_to_existing(local_locations)
+        local_locations = LocationArray.from_positions(points)
 
-        super().__init__(self.local_locations)
+        super().__init__(Locations._move_to_existing(local_locations))
 
 
 class PolarLocations(LocationList):
@@ -518,20 +602,19 @@ class PolarLocations(LocationList):
 
         angle_step = angular_range / count
 
-        # Note: rotate==False==0 so the location orientation doesn't change
-        local_locations = []
-        for i in range(count):
-            local_locations.append(
-                Location(
-                    Vector(radius, 0).rotate(Axis.Z, start_angle + angle_step * i),
-                    Vector(0, 0, 1),
-                    rotate * (angle_step * i + start_angle),
-                )
+        angles = np.radians(start_angle + angle_step * np.arange(count))
+        local_locations = LocationArray.from_positions(
+            np.column_stack(
+                [radius * np.cos(angles), radius * np.sin(angles), np.zeros(count)]
             )
+        )
+        if rotate:
+            # Rotate each location about its Z axis to align with the arc tangent
+            cos, sin = np.cos(angles), np.sin(angles)
+            local_locations.matrices[:, 0, :2] = np.column_stack([cos, -sin])
+            local_locations.matrices[:, 1, :2] = np.column_stack([sin, cos])
 
-        self.local_locations = Locations._move_to_existing(local_locations)
-
-        super().__init__(self.local_locations)
+        super().__init__(Locations._move_to_existing(local_locations))
 
 
 class Locations(LocationList):
@@ -540,14 +623,25 @@ class Locations(LocationList):
     Creates a context of locations for Part or Sketch
 
     Args:
-        pts (Union[VectorLike, Vertex, Location]): sequence of points to push
+        pts (Union[VectorLike, Vertex, Location, LocationArray, Face, Plane, Axis]):
+            sequence of points to push
     """
 
-    def __init__(self, *pts: Union[VectorLike, Vertex, Location, Face, Plane, Axis]):
-        local_locations = []
+    def __init__(
+        self,
+        *pts: Union[VectorLike, Vertex, Location, LocationArray, Face, Plane, Axis],
+    ):
+        local_locations: list[Location] = []
+        matrices: list[np.ndarray] = []
         for point in pts:
             if isinstance(point, Location):
                 local_locations.append(point)
+            elif isinstance(point, LocationArray):
+                # Pass the array through without creating a Location for each entry
+                matrices.extend(
+                    [Location._to_matrices(local_locations), point.matrices]
+                )
+                local_locations = []
             elif isinstance(point, Vector):
                 local_locations.append(Location(point))
             elif isinstance(point, Vertex):
@@ -563,37 +657,28 @@ class Locations(LocationList):
             else:
                 raise ValueError(f"Locations doesn't accept type {type(point)}")
 
-        self.local_locations = Locations._move_to_existing(local_locations)
-        super().__init__(self.local_locations)
+        matrices.append(Location._to_matrices(local_locations))
+        super().__init__(
+            Locations._move_to_existing(LocationArray(np.concatenate(matrices)))
+        )
 
     @staticmethod
-    def _move_to_existing(local_locations: list[Location]) -> list[Location]:
+    def _move_to_existing(local_locations: LocationArray) -> LocationArray:
         """_move_to_existing
 
         Move as a group the local locations to any existing locations  Note that existing
         polar locations may be rotated so this rotates the group not the individuals.
 
         Args:
-            local_locations (list[Location]): location group to move to existing locations
+            local_locations (LocationArray): location group to move to existing
+                locations
 
         Returns:
-            list[Location]: group of locations moved to existing locations as a group
+            LocationArray: group of locations moved to existing locations as a group
         """
-        location_group = []
-        if LocationList._get_context():
-            local_vertex_compound = Compound.make_compound(
-                [Face.make_rect(1, 1).locate(l) for l in local_locations]
-            )
-            for group_center in LocationList._get_context().local_locations:
-                location_group.extend(
-                    [
-                        v.location
-                        for v in local_vertex_compound.moved(group_center).faces()
-                    ]
-                )
-        else:
-            location_group = local_locations
-        return location_group
+        if not LocationList._get_context():
+            return local_locations
+        return LocationList._get_context().local_location_array.outer(local_locations)
 
 
 class GridLocations(LocationList):
@@ -641,21 +726,19 @@ class GridLocations(LocationList):
             elif align[i] == Align.MAX:
                 align_offset.append(-size[i])
 
-        # Create the list of local locations
-        local_locations = []
-        for i, j in product(range(x_count), range(y_count)):
-            local_locations.append(
-                Location(
-                    Vector(
-                        i * x_spacing + align_offset[0],
-                        j * y_spacing + align_offset[1],
-                    )
-                )
+        # Create the local locations, ordered by column then row
+        local_locations = LocationArray.from_positions(
+            np.column_stack(
+                [
+                    np.arange(x_count).repeat(y_count) * x_spacing + align_offset[0],
+                    np.tile(np.arange(y_count), x_count) * y_spacing + align_offset[1],
+                    np.zeros(x_count * y_count),
+                ]
             )
+        )
 
-        self.local_locations = Locations._move_to_existing(local_locations)
         self.planes: list[Plane] = []
-        super().__init__(self.local_locations)
+        super().__init__(Locations._move_to_existing(local_locations))
 
 
 class WorkplaneList:
@@ -774,6 +857,161 @@ class Workplanes(WorkplaneList):
         super().__init__(self.workplanes)
 
 
+class ObjectCache:
+    """Object Cache
+
+    A least recently used cache of the objects created by BasePartObject and
+    BaseSketchObject subclasses keyed on their constructor arguments. Calling the
+    cache with a class returns a subclass whose objects are only built once for
+    each set of arguments, later objects share the TShape of the first and are
+    just positioned at the current locations.
+
+    .. code::
+
+        part_cache = ObjectCache(max_size=256)
+        CachedBox = part_cache(Box)
+
+        @part_cache
+        class Bracket(BasePartObject):
+            ...
+
+    Only cache classes whose objects depend solely on their arguments. Classes list
+    the arguments that make their objects depend on the current builder when None
+    in ``_context_arguments`` - for example, holes without a depth size themselves
+    to the current part - and these objects are rejected.
+
+    The attributes of a cached object are deep copied to each object created from
+    it, with any references to the cached object (e.g. the parent of a Joint)
+    replaced by the new object.
+
+    Args:
+        max_size (int, optional): maximum number of objects. Defaults to 128.
+
+    Raises:
+        ValueError: a cached object would depend on the current builder
+    """
+
+    # Attributes set by the base object classes that are unique to each object
+    _instance_attributes = ("wrapped", "_NodeMixin__children", "_NodeMixin__parent")
+
+    # Arguments passed to the base object class of objects being built, by id
+    _base_arguments: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+        "ObjectCache._base_arguments", default=None
+    )
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries and reset the statistics"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, cls: type) -> type:
+        """Return a subclass of cls whose objects are cached"""
+        cache = self
+        signature = inspect.signature(cls)
+
+        def __init__(obj, *args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            for name in getattr(cls, "_context_arguments", ()):
+                if name in bound.arguments and bound.arguments[name] is None:
+                    raise ValueError(
+                        f"{cls.__name__} objects without a {name} depend on the "
+                        "current builder and can't be cached"
+                    )
+            try:
+                key = (cls, ObjectCache._freeze(list(bound.arguments.values())))
+                hash(key)
+            except TypeError:  # an argument can't be used as a key
+                cls.__init__(obj, *args, **kwargs)
+                return
+
+            entry = cache._entries.get(key)
+            if entry is not None:
+                cache._entries.move_to_end(key)
+                cache.hits += 1
+                # cls.__init__ isn't called so check the current builder here
+                context = Builder._current.get(None)
+                if context is None:
+                    raise RuntimeError(
+                        f"No valid context found, use one of {obj._applies_to}"
+                    )
+                context.validate_inputs(obj)
+                source, attributes, base_init, shape, base_args = entry
+                base_init(obj, copy.copy(shape), *base_args)
+                # Copy the mutable attributes, rebinding references to the source
+                memo = {id(source): obj, id(source.wrapped): obj.wrapped}
+                for name, value in attributes.items():
+                    setattr(obj, name, copy.deepcopy(value, memo))
+                return
+
+            cache.misses += 1
+            recorded = {}
+            token = ObjectCache._base_arguments.set(recorded)
+            try:
+                cls.__init__(obj, *args, **kwargs)
+            finally:
+                ObjectCache._base_arguments.reset(token)
+            if id(obj) in recorded:
+                # Snapshot the attributes once the object is complete so the ones set
+                # by cls after the base class __init__ are included
+                attributes = {
+                    name: copy.deepcopy(value, {id(obj): obj})
+                    for name, value in obj.__dict__.items()
+                    if name not in ObjectCache._instance_attributes
+                }
+                cache._entries[key] = (obj, attributes) + recorded[id(obj)]
+                while len(cache._entries) > cache.max_size:
+                    cache._entries.popitem(last=False)
+
+        return type(
+            cls.__name__,
+            (cls,),
+            {
+                "__init__": __init__,
+                "__doc__": cls.__doc__,
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+            },
+        )
+
+    @staticmethod
+    def _record(obj, base_init, shape: Shape, *base_args):
+        """Record the arguments an object passed to its base class if being cached
+
+        Called by the base object classes before they modify shape or obj.
+        """
+        recorded = ObjectCache._base_arguments.get()
+        if recorded is not None:
+            recorded[id(obj)] = (base_init, copy.copy(shape), base_args)
+
+    @staticmethod
+    def _freeze(value):
+        """Convert value into a hashable key"""
+        if isinstance(value, Shape):
+            return (type(value), value.geometry_digest())
+        if isinstance(value, (Vector, Location)):
+            return (type(value), value.to_tuple())
+        if isinstance(value, Plane):
+            return (Plane,) + tuple(
+                axis.to_tuple() for axis in (value.origin, value.x_dir, value.z_dir)
+            )
+        if isinstance(value, (list, tuple)):
+            return (type(value), tuple(ObjectCache._freeze(v) for v in value))
+        if isinstance(value, dict):
+            return tuple(sorted((k, ObjectCache._freeze(v)) for k, v in value.items()))
+        return value
+
+
 #
 # To avoid import loops, Vector add & sub are monkey-patched
 def _vector_add(self: Vector, vec: VectorLike) -> Vector:
@@ -570,7 +570,7 @@ class Split(Compound):
 
         new_objects = []
         for obj in objects:
-            max_size = obj.bounding_box().diagonal
+            max_size = obj.bounding_box(optimal=False).diagonal
 
             cutters = []
             if keep == Keep.BOTH:
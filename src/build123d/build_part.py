@@ -29,10 +29,11 @@ license:
 
 """
 from __future__ import annotations
+import copy
 import inspect
 import sys
 from math import radians, tan
-from typing import Union, Iterable
+from typing import Optional, Union, Iterable
 from build123d.build_enums import Mode, Until, Transition, Align
 from build123d.geometry import (
     Axis,
@@ -48,6 +49,7 @@ from build123d.topology import (
     Edge,
     Face,
     Shell,
+    ShapeList,
     Solid,
     Wire,
 )
@@ -56,6 +58,7 @@ from build123d.build_common import (
     Builder,
     logger,
     LocationList,
+    ObjectCache,
     WorkplaneList,
 )
 
@@ -68,6 +71,10 @@ class BuildPart(Builder):
     Args:
         workplane (Plane, optional): initial plane to work on. Defaults to Plane.XY.
         mode (Mode, optional): combination mode. Defaults to Mode.ADD.
+        deferred_booleans (bool, optional): accumulate consecutive ADD or SUBTRACT
+            objects and combine them with the part in a single boolean operation when
+            the part (or the last operation's objects) is next accessed.
+            Defaults to False.
 
     """
 
@@ -75,6 +82,16 @@ class BuildPart(Builder):
     def _tag() -> str:
         return BuildPart
 
+    @property
+    def part(self) -> Compound:
+        """The part being built - any deferred boolean operations are performed first"""
+        self._perform_deferred_booleans()
+        return self._part
+
+    @part.setter
+    def part(self, value: Compound):
+        self._part = value
+
     @property
     def _obj(self):
         return self.part
@@ -92,7 +109,12 @@ class BuildPart(Builder):
         self,
         *workplanes: Union[Face, Plane, Location],
         mode: Mode = Mode.ADD,
+        deferred_booleans: bool = False,
     ):
+        self.deferred_booleans = deferred_booleans
+        self._deferred_solids: list[Solid] = []
+        self._deferred_mode: Optional[Mode] = None
+        self._deferred_clean = False
         self.part: Compound = None
         self.initial_planes = workplanes
         self.pending_faces: list[Face] = []
@@ -100,8 +122,6 @@ class BuildPart(Builder):
         self.pending_planes: list[Plane] = []
         self.pending_edges: list[Edge] = []
         # self.pending_edge_planes: list[Plane] = []
-        self.last_faces = []
-        self.last_solids = []
         super().__init__(*workplanes, mode=mode)
 
     def _add_to_pending(self, *objects: Union[Edge, Face], face_plane: Plane = None):
@@ -179,58 +199,94 @@ class BuildPart(Builder):
                 new_solids.extend(new_faces)
                 new_faces = []
 
-            pre_vertices = set() if self.part is None else set(self.part.vertices())
-            pre_edges = set() if self.part is None else set(self.part.edges())
-            pre_faces = set() if self.part is None else set(self.part.faces())
-            pre_solids = set() if self.part is None else set(self.part.solids())
-
-            if new_solids:
+            if (
+                self.deferred_booleans
+                and new_solids
+                and mode in [Mode.ADD, Mode.SUBTRACT]
+            ):
+                # Operations of different modes don't commute
+                if self._deferred_solids and self._deferred_mode != mode:
+                    self._perform_deferred_booleans()
+                if mode == Mode.SUBTRACT and self._part is None:
+                    raise RuntimeError("Nothing to subtract from")
                 logger.debug(
-                    "Attempting to integrate %d object(s) into part with Mode=%s",
-                    len(new_solids),
-                    mode,
-                )
-                if mode == Mode.ADD:
-                    if self.part is None:
-                        if len(new_solids) == 1:
-                            self.part = new_solids[0]
-                        else:
-                            self.part = new_solids.pop().fuse(*new_solids)
-                    else:
-                        self.part = self.part.fuse(*new_solids)
-                elif mode == Mode.SUBTRACT:
-                    if self.part is None:
-                        raise RuntimeError("Nothing to subtract from")
-                    self.part = self.part.cut(*new_solids)
-                elif mode == Mode.INTERSECT:
-                    if self.part is None:
-                        raise RuntimeError("Nothing to intersect with")
-                    self.part = self.part.intersect(*new_solids)
-                elif mode == Mode.REPLACE:
-                    self.part = Compound.make_compound(list(new_solids))
-                if clean:
-                    self.part = self.part.clean()
-
-                logger.info(
-                    "Completed integrating %d object(s) into part with Mode=%s",
+                    "Deferring integration of %d object(s) into part with Mode=%s",
                     len(new_solids),
                     mode,
                 )
-
-            post_vertices = set() if self.part is None else set(self.part.vertices())
-            post_edges = set() if self.part is None else set(self.part.edges())
-            post_faces = set() if self.part is None else set(self.part.faces())
-            post_solids = set() if self.part is None else set(self.part.solids())
-            self.last_vertices = list(post_vertices - pre_vertices)
-            self.last_edges = list(post_edges - pre_edges)
-            self.last_faces = list(post_faces - pre_faces)
-            self.last_solids = list(post_solids - pre_solids)
+                self._deferred_solids.extend(new_solids)
+                self._deferred_mode = mode
+                self._deferred_clean = self._deferred_clean or clean
+            else:
+                self._combine_solids(new_solids, mode, clean)
 
             self._add_to_pending(*new_edges)
             for plane in WorkplaneList._get_context().workplanes:
                 global_faces = [plane.from_local_coords(face) for face in new_faces]
                 self._add_to_pending(*global_faces, face_plane=plane)
 
+    def _combine_solids(self, new_solids: list[Solid], mode: Mode, clean: bool):
+        """Combine solids with the part and record the operation
+
+        Args:
+            new_solids (list[Solid]): solids to combine with the part
+            mode (Mode): combination mode
+            clean (bool): Remove extraneous internal structure.
+
+        Raises:
+            RuntimeError: Nothing to subtract from
+            RuntimeError: Nothing to intersect with
+        """
+        pre_part = self.part
+
+        if new_solids:
+            logger.debug(
+                "Attempting to integrate %d object(s) into part with Mode=%s",
+                len(new_solids),
+                mode,
+            )
+            if mode == Mode.ADD:
+                if self.part is None:
+                    if len(new_solids) == 1:
+                        self.part = new_solids[0]
+                    else:
+                        self.part = new_solids.pop().fuse(*new_solids)
+                else:
+                    self.part = self.part.fuse(*new_solids)
+            elif mode == Mode.SUBTRACT:
+                if self.part is None:
+                    raise RuntimeError("Nothing to subtract from")
+                self.part = self.part.cut(*new_solids)
+            elif mode == Mode.INTERSECT:
+                if self.part is None:
+                    raise RuntimeError("Nothing to intersect with")
+                self.part = self.part.intersect(*new_solids)
+            elif mode == Mode.REPLACE:
+                self.part = Compound.make_compound(list(new_solids))
+            if clean:
+                self.part = self.part.clean()
+
+            logger.info(
+                "Completed integrating %d object(s) into part with Mode=%s",
+                len(new_solids),
+                mode,
+            )
+
+        self._record_operation(pre_part, self.part)
+
+    def _get_last(self, name: str) -> ShapeList:
+        """Return the objects of the given type changed by the last operation"""
+        self._perform_deferred_booleans()
+        return super()._get_last(name)
+
+    def _perform_deferred_booleans(self):
+        """Combine all of the deferred solids with the part in one operation"""
+        if not self._deferred_solids:
+            return
+        new_solids, self._deferred_solids = self._deferred_solids, []
+        clean, self._deferred_clean = self._deferred_clean, False
+        self._combine_solids(new_solids, self._deferred_mode, clean)
+
     @classmethod
     def _get_context(cls, caller=None) -> BuildPart:
         """Return the instance of the current builder"""
@@ -274,6 +330,7 @@ class BasePartObject(Compound):
         mode: Mode = Mode.ADD,
     ):
         context: BuildPart = BuildPart._get_context(self)
+        ObjectCache._record(self, BasePartObject.__init__, solid, rotation, align, mode)
 
         rotate = Rotation(*rotation) if isinstance(rotation, tuple) else rotation
         self.rotation = rotate
@@ -295,8 +352,9 @@ class BasePartObject(Compound):
 
         if not LocationList._get_context():
             raise RuntimeError("No valid context found")
+        # Instances share the solid's TShape so only the location of each is unique
         new_solids = [
-            solid.moved(location * rotate)
+            copy.copy(solid).move(location * rotate)
             for location in LocationList._get_context().locations
         ]
         context._add_to_context(*new_solids, mode=mode)
@@ -322,6 +380,7 @@ class CounterBoreHole(BasePartObject):
     """
 
     _applies_to = [BuildPart._tag()]
+    _context_arguments = ("depth",)
 
     def __init__(
         self,
@@ -366,6 +425,7 @@ class CounterSinkHole(BasePartObject):
     """
 
     _applies_to = [BuildPart._tag()]
+    _context_arguments = ("depth",)
 
     def __init__(
         self,
@@ -498,6 +558,7 @@ class Hole(BasePartObject):
     """
 
     _applies_to = [BuildPart._tag()]
+    _context_arguments = ("depth",)
 
     def __init__(
         self,
@@ -682,7 +743,7 @@ class Section(Compound):
         self.section_height = height
         self.mode = mode
 
-        max_size = context.part.bounding_box().diagonal
+        max_size = context.part.bounding_box(optimal=False).diagonal
 
         section_planes = (
             section_by if section_by else WorkplaneList._get_context().workplanes
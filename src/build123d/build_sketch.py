@@ -26,6 +26,7 @@ license:
 
 """
 from __future__ import annotations
+import copy
 import inspect
 from math import pi, sin, cos, tan, radians
 from typing import Union
@@ -38,7 +39,13 @@ from build123d.geometry import (
     VectorLike,
 )
 from build123d.topology import Compound, Edge, Face, ShapeList, Wire
-from build123d.build_common import Builder, logger, LocationList, WorkplaneList
+from build123d.build_common import (
+    Builder,
+    logger,
+    LocationList,
+    ObjectCache,
+    WorkplaneList,
+)
 
 
 class BuildSketch(Builder):
@@ -88,7 +95,6 @@ class BuildSketch(Builder):
         self.mode = mode
         self.sketch_local: Compound = None
         self.pending_edges: ShapeList[Edge] = ShapeList()
-        self.last_faces: ShapeList[Face] = ShapeList()
         super().__init__(*workplanes, mode=mode)
 
     def solids(self, *args):
@@ -139,17 +145,7 @@ class BuildSketch(Builder):
                 if isinstance(obj, Face) and not obj.is_coplanar(Plane.XY):
                     raise ValueError("Face not coplanar with sketch")
 
-            pre_vertices = (
-                set()
-                if self.sketch_local is None
-                else set(self.sketch_local.vertices())
-            )
-            pre_edges = (
-                set() if self.sketch_local is None else set(self.sketch_local.edges())
-            )
-            pre_faces = (
-                set() if self.sketch_local is None else set(self.sketch_local.faces())
-            )
+            pre_sketch = self.sketch_local
             if new_faces:
                 logger.debug(
                     "Attempting to integrate %d Face(s) into sketch with Mode=%s",
@@ -178,20 +174,7 @@ class BuildSketch(Builder):
                     mode,
                 )
 
-            post_vertices = (
-                set()
-                if self.sketch_local is None
-                else set(self.sketch_local.vertices())
-            )
-            post_edges = (
-                set() if self.sketch_local is None else set(self.sketch_local.edges())
-            )
-            post_faces = (
-                set() if self.sketch_local is None else set(self.sketch_local.faces())
-            )
-            self.last_vertices = ShapeList(post_vertices - pre_vertices)
-            self.last_edges = ShapeList(post_edges - pre_edges)
-            self.last_faces = ShapeList(post_faces - pre_faces)
+            self._record_operation(pre_sketch, self.sketch_local)
 
             self.pending_edges.extend(
                 new_edges + [e for w in new_wires for e in w.edges()]
@@ -306,6 +289,7 @@ class BaseSketchObject(Compound):
         mode: Mode = Mode.ADD,
     ):
         context: BuildSketch = BuildSketch._get_context(self)
+        ObjectCache._record(self, BaseSketchObject.__init__, obj, rotation, align, mode)
         self.rotation = rotation
         self.mode = mode
 
@@ -328,8 +312,9 @@ class BaseSketchObject(Compound):
             Location((0, 0, 0), (0, 0, 1), rotation) * Location(Vector(*align_offset))
         )
 
+        # Instances share the face's TShape so only the location of each is unique
         new_faces = [
-            face.moved(location)
+            copy.copy(face).move(location)
             for face in obj.faces()
             for location in LocationList._get_context().local_locations
         ]
@@ -37,6 +37,8 @@ import logging
 from math import degrees, pi, radians
 from typing import (
     Any,
+    Iterable,
+    Iterator,
     Optional,
     Sequence,
     Tuple,
@@ -46,6 +48,8 @@ from typing import overload
 
 from typing_extensions import Literal
 
+import numpy as np
+
 import OCP.GeomAbs as ga  # Geometry type enum
 import OCP.TopAbs as ta  # Topology type enum
 from OCP.Bnd import Bnd_Box, Bnd_OBB
@@ -61,7 +65,6 @@ from OCP.BRepBndLib import BRepBndLib
 from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeFace
 
 from OCP.BRepGProp import BRepGProp, BRepGProp_Face  # used for mass calculation
-from OCP.BRepMesh import BRepMesh_IncrementalMesh
 from OCP.GeomAPI import GeomAPI_ProjectPointOnSurf
 
 from OCP.gp import (
@@ -494,6 +497,15 @@ class Vector:
         """Return deepcopy of self"""
         return Vector(self.X, self.Y, self.Z)
 
+    def __getstate__(self) -> tuple[float, float, float]:
+        """Return the state of self for pickling"""
+        return self.to_tuple()
+
+    def __setstate__(self, state: tuple[float, float, float]):
+        """Restore the state of self from pickled data"""
+        self.vector_index = 0
+        self._wrapped = gp_Vec(*state)
+
     def to_pnt(self) -> gp_Pnt:
         """Convert to OCCT gp_Pnt object"""
         return gp_Pnt(self.wrapped.XYZ())
@@ -595,6 +607,17 @@ class Axis:
         """Return deepcopy of self"""
         return Axis(self.position, self.direction)
 
+    def __getstate__(self) -> tuple[tuple[float, float, float], ...]:
+        """Return the state of self for pickling"""
+        return (self.position.to_tuple(), self.direction.to_tuple())
+
+    def __setstate__(self, state: tuple[tuple[float, float, float], ...]):
+        """Restore the state of self from pickled data"""
+        position, direction = state
+        self.wrapped = gp_Ax1(gp_Pnt(*position), gp_Dir(*direction))
+        self.position = Vector(*position)
+        self.direction = Vector(self.wrapped.Direction())
+
     def __repr__(self) -> str:
         """Display self"""
         return f"({self.position.to_tuple()},{self.direction.to_tuple()})"
@@ -827,7 +850,9 @@ class BoundBox:
         Args:
             shape: TopoDS_Shape:
             tolerance: float:  (Default value = None)
-            optimal: bool:  This algorithm builds precise bounding box (Default value = True)
+            optimal: bool:  This algorithm builds precise bounding box, otherwise
+                a larger box is quickly found from any existing triangulation or the
+                geometry (Default value = True)
 
         Returns:
 
@@ -843,8 +868,6 @@ class BoundBox:
             else:
                 BRepBndLib.AddOptimal_s(shape, bbox)
         else:
-            mesh = BRepMesh_IncrementalMesh(shape, tolerance, True)
-            mesh.Perform()
             # this is adds +margin but is faster
             if oriented:
                 BRepBndLib.AddOBB_s(shape, bbox_obb)
@@ -942,6 +965,22 @@ class Color:
 
         return (rgb.Red(), rgb.Green(), rgb.Blue(), alpha)
 
+    def __copy__(self) -> Color:
+        """Return copy of self"""
+        return Color(*self.to_tuple())
+
+    def __deepcopy__(self, _memo) -> Color:
+        """Return deepcopy of self"""
+        return Color(*self.to_tuple())
+
+    def __getstate__(self) -> tuple[float, float, float, float]:
+        """Return the state of self for pickling"""
+        return self.to_tuple()
+
+    def __setstate__(self, state: tuple[float, float, float, float]):
+        """Restore the state of self from pickled data"""
+        self.wrapped = Quantity_ColorRGBA(*state)
+
 
 class Location:
     """Location in 3D space. Depending on usage can be absolute or relative.
@@ -1134,8 +1173,59 @@ class Location:
         """Lib/copy.py deep copy"""
         return Location(self.wrapped.Transformation())
 
+    def __getstate__(self) -> dict:
+        """Return the state of self for pickling
+
+        The wrapped TopLoc_Location is stored as the 12 values of its transformation,
+        other attributes (e.g. the angles of a Rotation) are pickled as is.
+        """
+        transformation = self.wrapped.Transformation()
+        state = self.__dict__.copy()
+        state["wrapped"] = [
+            transformation.Value(row, col) for row in range(1, 4) for col in range(1, 5)
+        ]
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore the state of self from pickled data"""
+        transformation = gp_Trsf()
+        transformation.SetValues(*state["wrapped"])
+        state["wrapped"] = TopLoc_Location(transformation)
+        self.__dict__.update(state)
+
+    @staticmethod
+    def _to_matrices(locations: Sequence[Location]) -> np.ndarray:
+        """Stack the transformations of locations into an (N, 4, 4) array"""
+        values = []
+        for location in locations:
+            transformation = location.wrapped.Transformation()
+            values.extend(
+                transformation.Value(row, col)
+                for row in range(1, 4)
+                for col in range(1, 5)
+            )
+        matrices = np.zeros((len(locations), 4, 4))
+        matrices[:, :3, :] = np.reshape(values, (-1, 3, 4))
+        matrices[:, 3, 3] = 1.0
+        return matrices
+
+    @staticmethod
+    def _from_matrices(matrices: np.ndarray) -> list[Location]:
+        """Create Locations from an (N, 4, 4) array of transformations"""
+        locations = []
+        for values in matrices[:, :3, :].reshape(-1, 12).tolist():
+            transformation = gp_Trsf()
+            transformation.SetValues(*values)
+            # Bypass the argument parsing of __init__
+            location = Location.__new__(Location)
+            location.wrapped = TopLoc_Location(transformation)
+            locations.append(location)
+        return locations
+
     def __mul__(self, other: Location) -> Location:
         """Combine locations"""
+        if isinstance(other, LocationArray):
+            return NotImplemented
         return Location(self.wrapped * other.wrapped)
 
     def __pow__(self, exponent: int) -> Location:
@@ -1208,6 +1298,103 @@ class Rotation(Location):
 RotationLike = Union[tuple[float, float, float], Rotation]
 
 
+class LocationArray:
+    """Location Array
+
+    A sequence of Locations stored as an (N, 4, 4) numpy array of transformations.
+    Locations are only created when an element is accessed so large arrays of
+    locations can be composed, sliced and filtered in bulk. Indexing with an int
+    returns a Location while indexing with a slice, a boolean mask or an array of
+    indices returns a LocationArray, e.g.:
+
+    .. code::
+
+        in_bounds = locations[np.linalg.norm(locations.positions, axis=1) < 10]
+
+    Args:
+        locations (Union[Iterable[Location], np.ndarray], optional): locations or
+            an (N, 4, 4) array of transformations. Defaults to no locations.
+
+    Raises:
+        ValueError: invalid array shape
+    """
+
+    def __init__(self, locations: Union[Iterable[Location], np.ndarray] = ()):
+        if isinstance(locations, LocationArray):
+            self.matrices = locations.matrices.copy()
+        elif isinstance(locations, np.ndarray):
+            if locations.ndim != 3 or locations.shape[1:] != (4, 4):
+                raise ValueError(
+                    f"Expected an (N, 4, 4) array, received shape {locations.shape}"
+                )
+            self.matrices = locations.astype(float)
+        else:
+            self.matrices = Location._to_matrices(list(locations))
+
+    @classmethod
+    def from_positions(cls, positions: np.ndarray) -> LocationArray:
+        """Create a LocationArray of translations from an (N, 3) array of positions"""
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        matrices = np.tile(np.eye(4), (len(positions), 1, 1))
+        matrices[:, :3, 3] = positions
+        return cls(matrices)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 3) array of the position of each location"""
+        return self.matrices[:, :3, 3]
+
+    def outer(self, other: Union[Location, LocationArray]) -> LocationArray:
+        """Every location of self combined with every location of other
+
+        Equivalent to [a * b for a in self for b in other].
+
+        Args:
+            other (Union[Location, LocationArray]): locations to combine with
+
+        Returns:
+            LocationArray: len(self) * len(other) locations
+        """
+        other = LocationArray([other] if isinstance(other, Location) else other)
+        combined = self.matrices[:, np.newaxis] @ other.matrices[np.newaxis]
+        return LocationArray(combined.reshape(-1, 4, 4))
+
+    def __len__(self) -> int:
+        """Number of locations"""
+        return len(self.matrices)
+
+    def __iter__(self) -> Iterator[Location]:
+        """Iterate over the locations creating each as required"""
+        for matrix in self.matrices:
+            yield Location._from_matrices(matrix[np.newaxis])[0]
+
+    def __getitem__(
+        self, key: Union[int, slice, Sequence[int], np.ndarray]
+    ) -> Union[Location, LocationArray]:
+        """Location at index key or a LocationArray of the selected locations"""
+        if isinstance(key, (int, np.integer)):
+            return Location._from_matrices(self.matrices[key][np.newaxis])[0]
+        return LocationArray(self.matrices[key])
+
+    def __mul__(self, other: Union[Location, LocationArray]) -> LocationArray:
+        """Combine each location with other or the matching location of other"""
+        if isinstance(other, Location):
+            other = LocationArray([other])
+        elif not isinstance(other, LocationArray):
+            return NotImplemented
+        return LocationArray(self.matrices @ other.matrices)
+
+    def __rmul__(self, other: Location) -> LocationArray:
+        """Combine other with each location"""
+        if not isinstance(other, Location):
+            return NotImplemented
+        return LocationArray(LocationArray([other]).matrices @ self.matrices)
+
+    def __repr__(self) -> str:
+        """Display the locations"""
+        return f"LocationArray({list(self)})"
+
+
 class Matrix:
     """A 3d , 4x4 transformation matrix.
 
@@ -1594,6 +1781,15 @@ class Plane:
         """Return deepcopy of self"""
         return Plane(gp_Pln(self.wrapped.Position()))
 
+    def __getstate__(self) -> tuple[tuple[float, float, float], ...]:
+        """Return the state of self for pickling"""
+        return (self.origin.to_tuple(), self.x_dir.to_tuple(), self.z_dir.to_tuple())
+
+    def __setstate__(self, state: tuple[tuple[float, float, float], ...]):
+        """Restore the state of self from pickled data"""
+        # The coordinate systems derived from the origin and directions are rebuilt
+        self.__dict__.update(Plane(*state).__dict__)
+
     def __eq__(self, other: Plane):
         """Are planes equal"""
         return all(self._eq_iter(other))
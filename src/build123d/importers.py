@@ -29,23 +29,32 @@ license:
 # pylint: disable=no-name-in-module, import-error
 
 import os
+from io import BytesIO
 from math import degrees
+from typing import Union
 from svgpathtools import svg2paths
 from OCP.TopoDS import TopoDS_Face, TopoDS_Shape
 from OCP.BRep import BRep_Builder
 from OCP.BRepTools import BRepTools
+from OCP.BinTools import BinTools
 from OCP.STEPControl import STEPControl_Reader
 import OCP.IFSelect
 from OCP.RWStl import RWStl
 
 from build123d.topology import Compound, Edge, Face, Shape, ShapeList
 
+# Binary BREP data written by BinTools starts with this header, text BREP data
+# written by BRepTools starts with "\nCASCADE Topology"
+_BINARY_BREP_HEADER = b"\nOpen CASCADE Topology"
 
-def import_brep(file_name: str) -> Shape:
+
+def import_brep(file_name: Union[str, BytesIO], binary: bool = None) -> Shape:
     """Import shape from a BREP file
 
     Args:
-        file_name (str): brep file
+        file_name (Union[str, BytesIO]): brep file or stream
+        binary (bool, optional): the data is binary BREP as written by
+            export_brep(binary=True). Defaults to None which detects the format.
 
     Raises:
         ValueError: file not found
@@ -53,10 +62,14 @@ def import_brep(file_name: str) -> Shape:
     Returns:
         Shape: build123d object
     """
-    shape = TopoDS_Shape()
-    builder = BRep_Builder()
+    if binary is None:
+        binary = _is_binary_brep(file_name)
 
-    BRepTools.Read_s(shape, file_name, builder)
+    shape = TopoDS_Shape()
+    if binary:
+        BinTools.Read_s(shape, file_name)
+    else:
+        BRepTools.Read_s(shape, file_name, BRep_Builder())
 
     if shape.IsNull():
         raise ValueError(f"Could not import {file_name}")
@@ -64,6 +77,20 @@ def import_brep(file_name: str) -> Shape:
     return Shape.cast(shape)
 
 
+def _is_binary_brep(file_name: Union[str, BytesIO]) -> bool:
+    """Does the file or stream start with the header of a binary BREP file"""
+    if isinstance(file_name, str):
+        if not os.path.isfile(file_name):
+            return False
+        with open(file_name, "rb") as file:
+            header = file.read(len(_BINARY_BREP_HEADER))
+    else:
+        position = file_name.tell()
+        header = file_name.read(len(_BINARY_BREP_HEADER))
+        file_name.seek(position)
+    return header == _BINARY_BREP_HEADER
+
+
 def import_step(file_name: str) -> Compound:
     """import_step
 
@@ -0,0 +1,90 @@
+"""
+build123d parallel
+
+name: parallel.py
+date: October 17th, 2026
+
+desc:
+    This python module builds independent parts in parallel across processes.
+
+    Builders rely on context variables and the Python call stack so they can't be
+    shared between threads, but each process has its own. The results of the
+    build functions are pickled and returned to the calling process with their
+    shapes transported as binary BREP data along with their labels, colors,
+    materials, joints and assembly structure.
+
+    .. code::
+
+        from build123d.parallel import build_parts
+
+        def bracket(width: float, thickness: float) -> Part:
+            with BuildPart() as bracket:
+                ...
+            return bracket.part
+
+        brackets = build_parts(bracket, [10, 20, 30], [1, 1, 2])
+
+license:
+
+    Copyright 2022 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterable
+
+from build123d.build_common import Builder
+
+
+def build_parts(
+    build_function: Callable[..., Any],
+    *iterables: Iterable,
+    max_workers: int = None,
+    chunksize: int = 1,
+) -> list[Any]:
+    """Build Parts
+
+    Call build_function with arguments taken from each of the iterables, like
+    the builtin map, with the calls distributed across a pool of processes.
+
+    Args:
+        build_function (Callable[..., Any]): module level function that builds and
+            returns a Shape, a Builder (whose object is returned) or any other
+            picklable value which may contain Shapes
+        iterables (Iterable): arguments for each call, which may contain Shapes
+        max_workers (int, optional): number of processes. Defaults to the number
+            of processors.
+        chunksize (int, optional): number of calls sent to a process at once.
+            Defaults to 1.
+
+    Returns:
+        list[Any]: results of each call in order
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                _build, repeat(build_function), *iterables, chunksize=chunksize
+            )
+        )
+
+
+def _build(build_function: Callable[..., Any], *arguments: Any) -> Any:
+    """Call build_function in a worker process"""
+    result = build_function(*arguments)
+    if isinstance(result, Builder):
+        result = result._obj
+    return result
@@ -34,26 +34,45 @@ from __future__ import annotations
 #   too-many-arguments, too-many-locals, too-many-public-methods,
 #   too-many-statements, too-many-instance-attributes, too-many-branches
 import copy
+import hashlib
 import io as StringIO
 import logging
 import os
 import platform
 import sys
+import tempfile
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
 from io import BytesIO
-from itertools import combinations
 from math import degrees, radians, inf, pi, sqrt, sin, cos
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing import cast as tcast
 from typing import overload
 import xml.etree.cElementTree as ET
-from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+from collections import OrderedDict, defaultdict
+from zipfile import BadZipFile, ZipFile, ZIP_DEFLATED, ZIP_STORED, ZIP64_LIMIT
 
 import ezdxf
+import numpy as np
 from anytree import NodeMixin, PreOrderIter, RenderTree
-from scipy.spatial import ConvexHull
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import ConvexHull, cKDTree
 from typing_extensions import Literal
 from vtkmodules.vtkCommonDataModel import vtkPolyData
 from vtkmodules.vtkFiltersCore import vtkPolyDataNormals, vtkTriangleFilter
@@ -61,6 +80,7 @@ from vtkmodules.vtkFiltersCore import vtkPolyDataNormals, vtkTriangleFilter
 import OCP.GeomAbs as ga  # Geometry type enum
 import OCP.TopAbs as ta  # Topology type enum
 from OCP.Aspect import Aspect_TOL_SOLID
+from OCP.Bnd import Bnd_Box
 from OCP.BOPAlgo import BOPAlgo_GlueEnum
 
 # used for getting underlying geometry -- is this equivalent to brep adaptor?
@@ -129,6 +149,7 @@ from OCP.BRepPrimAPI import (
     BRepPrimAPI_MakeWedge,
 )
 from OCP.BRepProj import BRepProj_Projection
+from OCP.BinTools import BinTools, BinTools_FormatVersion
 from OCP.BRepTools import BRepTools
 from OCP.Font import (
     Font_FA_Bold,
@@ -239,8 +260,10 @@ from OCP.TopoDS import (
     TopoDS_Wire,
 )
 from OCP.TopTools import (
+    TopTools_FormatVersion,
     TopTools_HSequenceOfShape,
     TopTools_IndexedDataMapOfShapeListOfShape,
+    TopTools_IndexedMapOfShape,
     TopTools_ListOfShape,
 )
 from build123d.build_enums import (
@@ -380,6 +403,10 @@ Geoms = Literal[
 class Mixin1D:
     """Methods to add to the Edge and Wire classes"""
 
+    # Smallest batch of distances converted to parameters with an arc length table,
+    # smaller batches locate each distance unless the table is already cached
+    _arc_length_table_threshold = 64
+
     def start_point(self) -> Vector:
         """The start point of this edge
 
@@ -495,9 +522,7 @@ class Mixin1D:
         if center_of == CenterOf.GEOMETRY:
             middle = self.position_at(0.5)
         elif center_of == CenterOf.MASS:
-            properties = GProp_GProps()
-            BRepGProp.LinearProperties_s(self.wrapped, properties)
-            middle = Vector(properties.CentreOfMass())
+            middle = self._mass_properties(BRepGProp.LinearProperties_s)[1]
         elif center_of == CenterOf.BOUNDING_BOX:
             middle = self.bounding_box().center()
         return middle
@@ -574,7 +599,201 @@ class Mixin1D:
         Returns:
             list[Vector]: positions along curve
         """
-        return [self.position_at(d, position_mode) for d in distances]
+        params = self._params(distances, position_mode)
+        return [Vector(*point) for point in self._evaluate(params).tolist()]
+
+    def sample(
+        self,
+        distances: Iterable[float],
+        position_mode: PositionMode = PositionMode.LENGTH,
+        frame_method: FrameMethod = FrameMethod.FRENET,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sample curve
+
+        Evaluate positions, tangents and moving frames at many points along the
+        underlying curve with a single curve adaptor and trihedron law. Large batches
+        of distances are converted to parameters by interpolating a table of arc
+        lengths which is calculated once per shape, small batches are located along
+        the curve one by one.
+
+        Args:
+            distances (Iterable[float]): distance or parameter values
+            position_mode (PositionMode, optional): position calculation mode.
+                Defaults to PositionMode.LENGTH.
+            frame_method (FrameMethod, optional): moving frame calculation method.
+                Defaults to FrameMethod.FRENET.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: (N, 3) positions, (N, 3) unit
+                tangents and (N, 3, 3) frames whose rows are the tangent, normal and
+                binormal of the trihedron law
+        """
+        params = self._params(distances, position_mode)
+        curve = self._geom_adaptor()
+
+        law: GeomFill_TrihedronLaw
+        if frame_method == FrameMethod.FRENET:
+            law = GeomFill_Frenet()
+        else:
+            law = GeomFill_CorrectedFrenet()
+        law.SetCurve(curve)
+
+        positions = np.empty((len(params), 3))
+        tangents = np.empty((len(params), 3))
+        frames = np.empty((len(params), 3, 3))
+        pnt, derivative = gp_Pnt(), gp_Vec()
+        tangent, normal, binormal = gp_Vec(), gp_Vec(), gp_Vec()
+        for i, param in enumerate(params.tolist()):
+            curve.D1(param, pnt, derivative)
+            law.D0(param, tangent, normal, binormal)
+            positions[i] = (pnt.X(), pnt.Y(), pnt.Z())
+            tangents[i] = (derivative.X(), derivative.Y(), derivative.Z())
+            frames[i] = (
+                (tangent.X(), tangent.Y(), tangent.Z()),
+                (normal.X(), normal.Y(), normal.Z()),
+                (binormal.X(), binormal.Y(), binormal.Z()),
+            )
+        tangents /= np.linalg.norm(tangents, axis=1)[:, np.newaxis]
+        return positions, tangents, frames
+
+    def _params(
+        self, distances: Iterable[float], position_mode: PositionMode
+    ) -> np.ndarray:
+        """Curve parameters at the given distances or parameter values"""
+        distances = np.asarray(list(distances), dtype=float).reshape(-1)
+        if position_mode != PositionMode.LENGTH:
+            return distances
+
+        table = self._arc_length_table(
+            cached_only=len(distances) < Mixin1D._arc_length_table_threshold
+        )
+        if table is None:
+            return np.array([self.param_at(distance) for distance in distances])
+        lengths, params, slopes = table
+        # Cubic Hermite interpolation of the parameter as a function of length
+        index = np.clip(
+            np.searchsorted(lengths, distances, "right") - 1, 0, len(lengths) - 2
+        )
+        step = lengths[index + 1] - lengths[index]
+        t = np.clip((distances - lengths[index]) / step, 0.0, 1.0)
+        result = (
+            (2 * t**3 - 3 * t**2 + 1) * params[index]
+            + (t**3 - 2 * t**2 + t) * step * slopes[index, 0]
+            + (-2 * t**3 + 3 * t**2) * params[index + 1]
+            + (t**3 - t**2) * step * slopes[index, 1]
+        )
+        # Distances beyond the ends of the curve extrapolate along it
+        for i in np.flatnonzero((distances < 0) | (distances > 1)):
+            result[i] = self.param_at(distances[i])
+        return result
+
+    def _arc_length_table(
+        self, cached_only: bool = False
+    ) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Arc length table
+
+        Normalized arc lengths at increasing parameter values along the curve and the
+        rate of change of the parameter with normalized length at both ends of each
+        interval between them.
+
+        Args:
+            cached_only (bool, optional): return None instead of calculating a table
+                that isn't cached. Defaults to False.
+        """
+
+        def compute() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            curve = self._geom_adaptor()
+            first, last = curve.FirstParameter(), curve.LastParameter()
+            if curve.GetType() in [ga.GeomAbs_Line, ga.GeomAbs_Circle]:
+                # Constant speed so the length is proportional to the parameter
+                params = np.array([first, last])
+            else:
+                # Include the breaks in continuity, e.g. the vertices of a Wire
+                breaks = TColStd_Array1OfReal(1, curve.NbIntervals(ga.GeomAbs_C2) + 1)
+                curve.Intervals(breaks, ga.GeomAbs_C2)
+                params = np.unique(
+                    np.concatenate(
+                        [
+                            np.linspace(first, last, 257),
+                            [breaks.Value(i) for i in range(1, breaks.Length() + 1)],
+                        ]
+                    )
+                )
+                # Remove breaks (nearly) coincident with the samples
+                distinct = np.diff(params) > 1e-9 * (last - first)
+                params = np.append(params[:-1][distinct], params[-1])
+            lengths = np.zeros(len(params))
+            lengths[1:] = np.cumsum(
+                [
+                    GCPnts_AbscissaPoint.Length_s(curve, start, end)
+                    for start, end in zip(params[:-1].tolist(), params[1:].tolist())
+                ]
+            )
+            total_length = lengths[-1]
+            lengths /= total_length
+
+            # The speed is evaluated just inside each interval as it may change
+            # abruptly at the breaks
+            inset = 1e-9 * (params[1:] - params[:-1])
+            pnt, derivative = gp_Pnt(), gp_Vec()
+            speeds = np.empty((len(params) - 1, 2))
+            for i, (start, end) in enumerate(
+                zip((params[:-1] + inset).tolist(), (params[1:] - inset).tolist())
+            ):
+                curve.D1(start, pnt, derivative)
+                speeds[i, 0] = derivative.Magnitude()
+                curve.D1(end, pnt, derivative)
+                speeds[i, 1] = derivative.Magnitude()
+            with np.errstate(divide="ignore"):
+                slopes = total_length / speeds
+            # Fall back to linear interpolation where the curve is (nearly) stationary
+            secants = np.diff(params) / np.diff(lengths)
+            invalid = ~np.isfinite(slopes) | (slopes > 1e3 * secants[:, np.newaxis])
+            slopes[invalid] = np.broadcast_to(secants[:, np.newaxis], slopes.shape)[
+                invalid
+            ]
+            return lengths, params, slopes
+
+        shape = self.wrapped
+        cache = Shape.property_cache
+        if cached_only and not cache.contains(shape, "arc_length_table"):
+            return None
+        return cache.get(shape, "arc_length_table", compute)
+
+    def _evaluate(self, params: np.ndarray) -> np.ndarray:
+        """Evaluate the underlying curve at an array of parameter values
+
+        Lines and circles are evaluated with numpy, other curves point by point,
+        either way without the length calculations of position_at.
+
+        Args:
+            params (np.ndarray): parameter values
+
+        Returns:
+            np.ndarray: (N, 3) array of positions
+        """
+        curve = self._geom_adaptor()
+        params = np.asarray(params, dtype=float)
+        curve_type = curve.GetType()
+        if curve_type == ga.GeomAbs_Line:
+            line = curve.Line()
+            origin = np.array(Vector(line.Location()).to_tuple())
+            direction = np.array(Vector(line.Direction()).to_tuple())
+            return origin + params[:, np.newaxis] * direction
+        if curve_type == ga.GeomAbs_Circle:
+            circle = curve.Circle()
+            center = np.array(Vector(circle.Location()).to_tuple())
+            x_dir = np.array(Vector(circle.XAxis().Direction()).to_tuple())
+            y_dir = np.array(Vector(circle.YAxis().Direction()).to_tuple())
+            return center + circle.Radius() * (
+                np.cos(params)[:, np.newaxis] * x_dir
+                + np.sin(params)[:, np.newaxis] * y_dir
+            )
+        points = np.empty((len(params), 3))
+        for i, param in enumerate(params.tolist()):
+            point = curve.Value(param)
+            points[i] = (point.X(), point.Y(), point.Z())
+        return points
 
     def location_at(
         self,
@@ -654,9 +873,22 @@ class Mixin1D:
             list[Location]: A list of Location objects representing local coordinate
                 systems at the specified distances.
         """
-        return [
-            self.location_at(d, position_mode, frame_method, planar) for d in distances
-        ]
+        positions, _tangents, frames = self.sample(
+            distances, position_mode, frame_method
+        )
+        locations = []
+        for position, (tangent, normal, _binormal) in zip(positions, frames):
+            transformation = gp_Trsf()
+            transformation.SetTransformation(
+                gp_Ax3(
+                    gp_Pnt(*position),
+                    gp_Dir(0, 0, 1) if planar else gp_Dir(*tangent),
+                    gp_Dir(*normal),
+                ),
+                gp_Ax3(),
+            )
+            locations.append(Location(TopLoc_Location(transformation)))
+        return locations
 
     def __matmul__(self: Union[Edge, Wire], position: float):
         """Position on wire operator"""
@@ -861,11 +1093,9 @@ class Mixin3D:
         if center_of == CenterOf.GEOMETRY:
             raise ValueError("Center of GEOMETRY is not supported for this object")
         if center_of == CenterOf.MASS:
-            properties = GProp_GProps()
             calc_function = shape_properties_LUT[shapetype(self.wrapped)]
             if calc_function:
-                calc_function(self.wrapped, properties)
-                middle = Vector(properties.CentreOfMass())
+                middle = self._mass_properties(calc_function)[1]
             else:
                 raise NotImplementedError
         elif center_of == CenterOf.BOUNDING_BOX:
@@ -1070,6 +1300,309 @@ class Mixin3D:
         return self.__class__(shape)
 
 
+# Record layout of a triangle in a binary STL file
+_STL_TRIANGLE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+
+class ShapePropertyCache:
+    """Shape Property Cache
+
+    A least recently used cache of the geometric properties (mass, center of mass,
+    bounding box) of shapes. Entries are keyed on the shape's TShape, Location and
+    Orientation so the properties of a shape are only calculated once no matter
+    how many Shape objects refer to it.
+
+    The cache only holds weak references to the shapes, an entry is removed once
+    the TopoDS_Shape it was calculated for is released. If the TShape of a shape is
+    modified in place, call :meth:`invalidate` with the shape.
+
+    The cache used by all shapes is ``Shape.property_cache``, disable it with:
+
+    .. code::
+
+        Shape.property_cache.max_size = 0
+
+    Args:
+        max_size (int, optional): maximum number of entries. Defaults to 512.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            tuple, tuple[weakref.ref, TopLoc_Location, Any]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, shape: TopoDS_Shape, name: str, compute: Callable[[], Any]) -> Any:
+        """Return the named property of shape, calling compute on a cache miss
+
+        Args:
+            shape (TopoDS_Shape): shape the property belongs to
+            name (str): name of the property (including any parameters)
+            compute (Callable[[], Any]): function that calculates the property
+
+        Returns:
+            Any: property value
+        """
+        if self.max_size <= 0:
+            return compute()
+
+        key = ShapePropertyCache._key(shape, name)
+        if self._is_valid(key, shape):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][2]
+
+        self.misses += 1
+        value = compute()
+        # The location of shape can be changed in place so it's stored separately
+        self._entries[key] = (
+            weakref.ref(shape, self._release_callback(key)),
+            shape.Location(),
+            value,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return value
+
+    def contains(self, shape: TopoDS_Shape, name: str) -> bool:
+        """Is the named property of shape cached"""
+        return self._is_valid(ShapePropertyCache._key(shape, name), shape)
+
+    @staticmethod
+    def _key(shape: TopoDS_Shape, name: str) -> tuple:
+        return (shape.HashCode(HASH_CODE_MAX), shape.Orientation(), name)
+
+    def _is_valid(self, key: tuple, shape: TopoDS_Shape) -> bool:
+        """Is the entry of key present and calculated for shape"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        reference, location, _value = entry
+        cached_shape = reference()
+        # A live reference guarantees the TShape hasn't been released and reused
+        return (
+            cached_shape is not None
+            and cached_shape.IsPartner(shape)
+            and location.IsEqual(shape.Location())
+        )
+
+    def _release_callback(self, key: tuple) -> Callable[[weakref.ref], None]:
+        """Create a callback that removes the entry of key once its shape is released"""
+
+        def release(reference: weakref.ref):
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is reference:
+                del self._entries[key]
+
+        return release
+
+    def invalidate(self, shape: Shape):
+        """Remove all of the entries that share the TShape of shape"""
+        stale = []
+        for key, (reference, _location, _value) in list(self._entries.items()):
+            cached_shape = reference()
+            if cached_shape is None or cached_shape.IsPartner(shape.wrapped):
+                stale.append(key)
+        for key in stale:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries and reset the statistics"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class TessellationCache:
+    """Tessellation Cache
+
+    A content addressed, on-disk cache of shape tessellations that persists between
+    processes. Entries are keyed on the :meth:`Shape.geometry_digest` of the shape
+    plus the tessellation tolerances so unchanged shapes don't need to be meshed
+    again. The least recently used entries are removed
+    once the cache grows beyond max_size bytes.
+
+    Enable the cache used by :meth:`Shape.tessellate`, :meth:`Shape.export_stl` and
+    :meth:`Shape.export_3mf` with:
+
+    .. code::
+
+        Shape.tessellation_cache = TessellationCache("~/.cache/build123d")
+
+    Args:
+        directory (str): directory to store the cache entries in
+        max_size (int, optional): maximum total size of the entries in bytes.
+            Defaults to 256MB.
+    """
+
+    def __init__(self, directory: str, max_size: int = 256 * 1024**2):
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Running total of the entry sizes, only recounted when eviction is needed
+        self._size: Optional[int] = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entry_paths())
+
+    @property
+    def size(self) -> int:
+        """Total size of the cache entries in bytes"""
+        return sum(os.path.getsize(path) for path in self._entry_paths())
+
+    def key(self, shape: Shape, tolerance: float, angular_tolerance: float) -> str:
+        """Key of the tessellation of shape with the given tolerances"""
+        digest = hashlib.sha256(shape.geometry_digest().encode())
+        digest.update(f"{tolerance!r},{angular_tolerance!r}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Return the cached vertices and triangles for key or None if not cached"""
+        path = self._path(key)
+        try:
+            with np.load(path) as entry:
+                tessellation = (entry["vertices"], entry["triangles"])
+            os.utime(path)  # mark as recently used
+        except (OSError, KeyError, ValueError, BadZipFile):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tessellation
+
+    def put(self, key: str, tessellation: tuple[np.ndarray, np.ndarray]):
+        """Store the vertices and triangles for key, evicting old entries if needed"""
+        path = self._path(key)
+        # Write to a temporary file first so other processes never see a partial entry
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as entry_file:
+            np.savez(entry_file, vertices=tessellation[0], triangles=tessellation[1])
+        entry_size = os.path.getsize(entry_file.name)
+        try:
+            replaced_size = os.path.getsize(path)
+        except OSError:
+            replaced_size = 0
+        os.replace(entry_file.name, path)
+
+        if self._size is None:
+            self._size = self.size
+        else:
+            self._size += entry_size - replaced_size
+        if self._size > self.max_size:
+            self._evict()
+
+    def clear(self):
+        """Remove all entries and reset the statistics"""
+        for path in self._entry_paths():
+            os.remove(path)
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npz")
+
+    def _entry_paths(self) -> list[str]:
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".npz")
+        ]
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache fits max_size
+
+        The directory is scanned so entries written by other processes are counted.
+        """
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(entry[1] for entry in entries)
+        for _mtime, entry_size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= entry_size
+        self._size = total_size
+
+
+class _TopologyIndex:
+    """Topology Index
+
+    Sub-shapes of a TopoDS_Shape as found by Shape._entities and Shape._entities_from.
+    An index is only valid for the TopoDS_Shape it was built from and is reset
+    when used with any other, or when the TShape it was built from is modified in
+    place (see :meth:`modified`). Copies of an index are empty.
+    """
+
+    # Number of in place modifications of the TShapes, by TShape hash code. As
+    # many shapes can share a TShape this is shared by all of the indices.
+    _modifications: dict[int, int] = {}
+
+    def __init__(self):
+        self._source: TopoDS_Shape = None
+        self._modification = 0
+        self.entities: dict[str, list[TopoDS_Shape]] = {}
+        self.ancestors: dict[
+            tuple[str, str], list[tuple[TopoDS_Shape, list[TopoDS_Shape]]]
+        ] = {}
+
+    @staticmethod
+    def _tshape_key(shape: TopoDS_Shape) -> int:
+        """Hash code of the TShape of shape, independent of its location"""
+        return shape.Located(TopLoc_Location()).HashCode(HASH_CODE_MAX)
+
+    @classmethod
+    def modified(cls, shape: TopoDS_Shape):
+        """Invalidate the indices of every shape that shares the TShape of shape"""
+        key = cls._tshape_key(shape)
+        cls._modifications[key] = cls._modifications.get(key, 0) + 1
+
+    def validate(self, shape: TopoDS_Shape) -> _TopologyIndex:
+        """Reset the index if it wasn't built from shape or shape has been modified"""
+        modification = self._modifications.get(self._tshape_key(shape), 0)
+        if (
+            self._source is None
+            or not self._source.IsEqual(shape)
+            or self._modification != modification
+        ):
+            # Use a separate handle as the location of shape can be changed in place
+            self._source = shape.Located(shape.Location())
+            self._modification = modification
+            self.entities = {}
+            self.ancestors = {}
+        return self
+
+    def __copy__(self) -> _TopologyIndex:
+        """Return a new empty index"""
+        return _TopologyIndex()
+
+    def __deepcopy__(self, _memo) -> _TopologyIndex:
+        """Return a new empty index"""
+        return _TopologyIndex()
+
+    def __reduce__(self):
+        """Pickle as a new empty index"""
+        return (_TopologyIndex, ())
+
+
 class Shape(NodeMixin):
     """Shape
 
@@ -1087,6 +1620,14 @@ class Shape(NodeMixin):
             Defaults to None.
     """
 
+    _topology_index: Optional[_TopologyIndex] = None
+
+    # Geometric properties are shared by all shapes with the same TShape & Location
+    property_cache = ShapePropertyCache()
+
+    # Optional TessellationCache shared by all shapes and processes
+    tessellation_cache: Optional[TessellationCache] = None
+
     def __init__(
         self,
         obj: TopoDS_Shape = None,
@@ -1115,6 +1656,25 @@ class Shape(NodeMixin):
         # parent must be set following children as post install accesses children
         self.parent = parent
 
+    @property
+    def cache_topology(self) -> bool:
+        """Cache the topology of this Shape
+
+        When enabled, the sub-shapes found by methods like vertices(), edges() or faces()
+        are stored and reused until this Shape is changed (e.g. relocated) which makes
+        repeated calls to these methods much faster. The stored sub-shapes are also
+        discarded when a shape sharing this Shape's TShape is modified in place.
+        Defaults to False.
+        """
+        return self._topology_index is not None
+
+    @cache_topology.setter
+    def cache_topology(self, value: bool):
+        if not value:
+            self._topology_index = None
+        elif self._topology_index is None:
+            self._topology_index = _TopologyIndex()
+
     @property
     def location(self) -> Location:
         """Get this Shape's Location"""
@@ -1344,17 +1904,24 @@ class Shape(NodeMixin):
 
     def export_stl(
         self,
-        file_name: str,
+        file_name: Union[str, BinaryIO],
         tolerance: float = 1e-3,
         angular_tolerance: float = 0.1,
         ascii_format: bool = False,
+        parallel: bool = False,
     ) -> bool:
         """Export STL
 
-        Exports a shape to a specified STL file.
+        Exports a shape to a specified STL file or to a writable binary file-like
+        object. File-like objects are written face by face so no copy of the whole
+        mesh is created, however the triangulation of every face is still stored in
+        the shape. If the shape already has a mesh created with other tolerances, a
+        copy of the shape is meshed and exported instead so the existing mesh is
+        kept.
 
         Args:
-            file_name (str): The path and file name to write the STL output to.
+            file_name (Union[str, BinaryIO]): The path and file name to write the STL
+                output to, or a writable binary file-like object (binary format only).
             tolerance (float, optional): A linear deflection setting which limits the distance
                 between a curve and its tessellation. Setting this value too low will result in
                 large meshes that can consume computing resources. Setting the value too high can
@@ -1364,26 +1931,124 @@ class Shape(NodeMixin):
                 between subsequent segments in a polyline. Defaults to 0.1.
             ascii_format (bool, optional): Export the file as ASCII (True) or binary (False)
                 STL format. Defaults to False (binary).
+            parallel (bool, optional): mesh the faces on OCCT's worker threads.
+                Defaults to False.
+
+        Raises:
+            ValueError: ASCII format requested for a file-like object
 
         Returns:
             bool: Success
         """
+        if ascii_format and not isinstance(file_name, str):
+            raise ValueError("ASCII STL files can only be written to a file name")
+
+        if Shape.tessellation_cache is not None and not ascii_format:
+            # Write the (possibly cached) tessellation instead of meshing
+            tessellation = self.tessellate_arrays(
+                tolerance, angular_tolerance, parallel
+            )
+            if isinstance(file_name, str):
+                with open(file_name, "wb") as stl_file:
+                    Shape._write_binary_stl(
+                        stl_file, len(tessellation[1]), [tessellation]
+                    )
+            else:
+                Shape._write_binary_stl(file_name, len(tessellation[1]), [tessellation])
+            return True
+
+        # BRepMesh keeps an existing triangulation that is within the linear tolerance
+        # regardless of the angular tolerance, so a shape meshed with other
+        # tolerances is copied without its mesh and the copy is exported instead
+        mesh_shape = self
+        if Shape._has_other_mesh(self.wrapped, tolerance, angular_tolerance):
+            mesh_shape = Shape.cast(
+                BRepBuilderAPI_Copy(self.wrapped, True, False).Shape()
+            )
         mesh = BRepMesh_IncrementalMesh(
-            self.wrapped, tolerance, True, angular_tolerance
+            mesh_shape.wrapped, tolerance, True, angular_tolerance, parallel
         )
         mesh.Perform()
 
-        writer = StlAPI_Writer()
+        if isinstance(file_name, str):
+            writer = StlAPI_Writer()
+            writer.ASCIIMode = ascii_format
+            return writer.Write(mesh_shape.wrapped, file_name)
 
-        if ascii_format:
-            writer.ASCIIMode = True
-        else:
-            writer.ASCIIMode = False
+        faces = [face.wrapped for face in mesh_shape.faces()]
+        triangle_count = 0
+        for face in faces:
+            poly = BRep_Tool.Triangulation_s(face, TopLoc_Location())
+            if poly is not None:
+                triangle_count += poly.NbTriangles()
+        Shape._write_binary_stl(
+            file_name,
+            triangle_count,
+            (Shape._triangulation_arrays(face) for face in faces),
+        )
+        return True
 
-        return writer.Write(self.wrapped, file_name)
+    @staticmethod
+    def _has_other_mesh(
+        shape: TopoDS_Shape, tolerance: float, angular_tolerance: float
+    ) -> bool:
+        """Does any face of shape have a mesh created with other tolerances"""
+        explorer = TopExp_Explorer(shape, TopAbs_ShapeEnum.TopAbs_FACE)
+        while explorer.More():
+            poly = BRep_Tool.Triangulation_s(
+                TopoDS.Face_s(explorer.Current()), TopLoc_Location()
+            )
+            if poly is not None:
+                # Meshes that weren't created by BRepMesh have no parameters
+                parameters = poly.Parameters()
+                if (
+                    parameters is None
+                    or not parameters.HasDeflection()
+                    or not parameters.HasAngle()
+                    or parameters.Deflection() != tolerance
+                    or parameters.Angle() != angular_tolerance
+                ):
+                    return True
+            explorer.Next()
+        return False
+
+    @staticmethod
+    def _write_binary_stl(
+        stream: BinaryIO,
+        triangle_count: int,
+        meshes: Iterable[Tuple[np.ndarray, np.ndarray]],
+    ):
+        """Stream meshes to a binary STL file
+
+        The triangle count required by the header is provided up front so the output
+        doesn't need to be seekable, then the meshes (for example one per face) are
+        written one at a time.
+        """
+        stream.write(b"Binary STL exported by build123d".ljust(80, b" "))
+        stream.write(np.array(triangle_count, dtype="<u4").tobytes())
+
+        for nodes, triangles in meshes:
+            if not triangles.size:
+                continue
+            corners = nodes[triangles]
+            normals = np.cross(
+                corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+            )
+            lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+            np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+            records = np.zeros(len(triangles), dtype=_STL_TRIANGLE)
+            records["normal"] = normals
+            records["vertices"] = corners
+            stream.write(records.tobytes())
 
     def export_3mf(
-        self, file_name: str, tolerance: float, angular_tolerance: float, unit: Unit
+        self,
+        file_name: str,
+        tolerance: float,
+        angular_tolerance: float,
+        unit: Unit,
+        parallel: bool = False,
     ):
         """export_3mf
 
@@ -1394,8 +2059,11 @@ class Shape(NodeMixin):
             tolerance (float): linear tolerance for tesselation
             angular_tolerance (float): angular tolerance for tesselation
             unit (Unit): model unit
+            parallel (bool, optional): mesh the faces of each child on OCCT's worker
+                threads. The children are still meshed one after another, so an
+                assembly of many small parts doesn't benefit. Defaults to False.
         """
-        tmfw = ThreeMF(self, tolerance, angular_tolerance, unit)
+        tmfw = ThreeMF(self, tolerance, angular_tolerance, unit, parallel)
         with open(file_name, "wb") as three_mf_file:
             tmfw.write_3mf(three_mf_file)
 
@@ -1424,17 +2092,49 @@ class Shape(NodeMixin):
 
         return writer.Write(file_name)
 
-    def export_brep(self, file: Union[str, BytesIO]) -> bool:
+    def export_brep(
+        self,
+        file: Union[str, BytesIO],
+        binary: bool = False,
+        triangulation: bool = True,
+    ) -> bool:
         """Export this shape to a BREP file
 
+        Binary BREP files load much faster than text BREP files and store any face
+        and edge meshes exactly, so a meshed shape doesn't need to be meshed again
+        after loading. They can only be read by OCCT based applications.
+
         Args:
-            file: Union[str, BytesIO]:
+            file: Union[str, BytesIO]: file name or stream
+            binary (bool, optional): write binary BREP data. Defaults to False.
+            triangulation (bool, optional): include any meshes of the faces and edges.
+                Defaults to True.
 
         Returns:
 
         """
-
-        return_value = BRepTools.Write_s(self.wrapped, file)
+        if binary:
+            # Version 4 files without the meshes of a meshed shape can't be read
+            # by OCCT 7.7, version 3 files are larger but don't have this issue
+            return_value = BinTools.Write_s(
+                self.wrapped,
+                file,
+                triangulation,
+                False,
+                BinTools_FormatVersion.BinTools_FormatVersion_CURRENT
+                if triangulation
+                else BinTools_FormatVersion.BinTools_FormatVersion_VERSION_3,
+            )
+        elif triangulation:
+            return_value = BRepTools.Write_s(self.wrapped, file)
+        else:
+            return_value = BRepTools.Write_s(
+                self.wrapped,
+                file,
+                False,
+                False,
+                TopTools_FormatVersion.TopTools_FormatVersion_CURRENT,
+            )
 
         return True if return_value is None else return_value
 
@@ -1585,6 +2285,194 @@ class Shape(NodeMixin):
         """
         return self.wrapped.HashCode(HASH_CODE_MAX)
 
+    def geometry_digest(self, precision: int = 6, include_location: bool = True) -> str:
+        """Geometry Digest
+
+        A deterministic hash of the shape's topology and geometry - the number of
+        sub-shapes of each type, the vertex positions, the parameters of the curve
+        and surface of every edge and face (poles, knots, weights, radii, etc.) and
+        the tolerances - that, unlike :meth:`hash_code`, is the same in every
+        process and for every copy of the shape. Shapes built the same way have the
+        same digest which enables cross-run caches and the detection of duplicate
+        parts.
+
+        Args:
+            precision (int, optional): number of decimal places all values are
+                rounded to before hashing. Defaults to 6.
+            include_location (bool, optional): include the location of the shape,
+                otherwise identical parts at different locations have the same
+                digest. Defaults to True.
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        shape = self.wrapped
+        if not include_location:
+            shape = shape.Located(TopLoc_Location())
+
+        def rounded(*values: float) -> str:
+            # Adding 0.0 replaces -0.0 with 0.0
+            return ",".join(
+                "%.*f" % (precision, round(value, precision) + 0.0) for value in values
+            )
+
+        def sub_shapes(shape_type: TopAbs_ShapeEnum) -> list[TopoDS_Shape]:
+            # Unique sub-shapes, independent of how TShapes are shared
+            shape_map = TopTools_IndexedMapOfShape()
+            TopExp.MapShapes_s(shape, shape_type, shape_map)
+            return [shape_map.FindKey(i) for i in range(1, shape_map.Extent() + 1)]
+
+        def placement(position: Union[gp_Ax2, gp_Ax3]) -> str:
+            return rounded(
+                *position.Location().Coord(),
+                *position.Direction().Coord(),
+                *position.XDirection().Coord(),
+            )
+
+        def points(values: Iterable[gp_Pnt]) -> str:
+            return ";".join(rounded(*value.Coord()) for value in values)
+
+        def curve_geometry(curve: BRepAdaptor_Curve) -> str:
+            curve_type = curve.GetType()
+            if curve_type == ga.GeomAbs_Line:
+                line = curve.Line()
+                return rounded(*line.Location().Coord(), *line.Direction().Coord())
+            if curve_type == ga.GeomAbs_Circle:
+                circle = curve.Circle()
+                return f"{placement(circle.Position())};{rounded(circle.Radius())}"
+            if curve_type in [ga.GeomAbs_Ellipse, ga.GeomAbs_Hyperbola]:
+                conic = (
+                    curve.Ellipse()
+                    if curve_type == ga.GeomAbs_Ellipse
+                    else curve.Hyperbola()
+                )
+                radii = rounded(conic.MajorRadius(), conic.MinorRadius())
+                return f"{placement(conic.Position())};{radii}"
+            if curve_type == ga.GeomAbs_Parabola:
+                parabola = curve.Parabola()
+                return f"{placement(parabola.Position())};{rounded(parabola.Focal())}"
+            if curve_type in [ga.GeomAbs_BezierCurve, ga.GeomAbs_BSplineCurve]:
+                is_bspline = curve_type == ga.GeomAbs_BSplineCurve
+                spline = curve.BSpline() if is_bspline else curve.Bezier()
+                poles = range(1, spline.NbPoles() + 1)
+                record = [
+                    str(spline.Degree()),
+                    points(spline.Pole(i) for i in poles),
+                    rounded(*(spline.Weight(i) for i in poles)),
+                ]
+                if is_bspline:
+                    knots = range(1, spline.NbKnots() + 1)
+                    record += [
+                        rounded(*(spline.Knot(i) for i in knots)),
+                        ",".join(str(spline.Multiplicity(i)) for i in knots),
+                        str(spline.IsPeriodic()),
+                    ]
+                return ";".join(record)
+            # Offset and other curves are sampled
+            first, last = curve.FirstParameter(), curve.LastParameter()
+            return points(
+                curve.Value(first + (last - first) * i / 8) for i in range(9)
+            )
+
+        def surface_geometry(surface: BRepAdaptor_Surface) -> str:
+            surface_type = surface.GetType()
+            if surface_type == ga.GeomAbs_Plane:
+                return rounded(*surface.Plane().Coefficients())
+            if surface_type == ga.GeomAbs_Cylinder:
+                cylinder = surface.Cylinder()
+                return f"{placement(cylinder.Position())};{rounded(cylinder.Radius())}"
+            if surface_type == ga.GeomAbs_Cone:
+                cone = surface.Cone()
+                size = rounded(cone.RefRadius(), cone.SemiAngle())
+                return f"{placement(cone.Position())};{size}"
+            if surface_type == ga.GeomAbs_Sphere:
+                sphere = surface.Sphere()
+                return f"{placement(sphere.Position())};{rounded(sphere.Radius())}"
+            if surface_type == ga.GeomAbs_Torus:
+                torus = surface.Torus()
+                radii = rounded(torus.MajorRadius(), torus.MinorRadius())
+                return f"{placement(torus.Position())};{radii}"
+            if surface_type in [ga.GeomAbs_BezierSurface, ga.GeomAbs_BSplineSurface]:
+                is_bspline = surface_type == ga.GeomAbs_BSplineSurface
+                spline = surface.BSpline() if is_bspline else surface.Bezier()
+                poles = [
+                    (i, j)
+                    for i in range(1, spline.NbUPoles() + 1)
+                    for j in range(1, spline.NbVPoles() + 1)
+                ]
+                record = [
+                    f"{spline.UDegree()},{spline.VDegree()},{spline.NbVPoles()}",
+                    points(spline.Pole(i, j) for i, j in poles),
+                    rounded(*(spline.Weight(i, j) for i, j in poles)),
+                ]
+                if is_bspline:
+                    u_knots = range(1, spline.NbUKnots() + 1)
+                    v_knots = range(1, spline.NbVKnots() + 1)
+                    record += [
+                        rounded(*(spline.UKnot(i) for i in u_knots)),
+                        ",".join(str(spline.UMultiplicity(i)) for i in u_knots),
+                        rounded(*(spline.VKnot(i) for i in v_knots)),
+                        ",".join(str(spline.VMultiplicity(i)) for i in v_knots),
+                        f"{spline.IsUPeriodic()},{spline.IsVPeriodic()}",
+                    ]
+                return ";".join(record)
+            # Surfaces of revolution and extrusion, offset and other surfaces are
+            # sampled on a grid
+            u_min, u_max = surface.FirstUParameter(), surface.LastUParameter()
+            v_min, v_max = surface.FirstVParameter(), surface.LastVParameter()
+            return points(
+                surface.Value(
+                    u_min + (u_max - u_min) * i / 4, v_min + (v_max - v_min) * j / 4
+                )
+                for i in range(5)
+                for j in range(5)
+            )
+
+        records = [
+            f"{name}:{len(sub_shapes(shape_type))}"
+            for shape_type, name in shape_LUT.items()
+        ]
+
+        records.extend(
+            sorted(
+                "VERTEX:"
+                + rounded(
+                    *BRep_Tool.Pnt_s(TopoDS.Vertex_s(vertex)).Coord(),
+                    BRep_Tool.Tolerance_s(TopoDS.Vertex_s(vertex)),
+                )
+                for vertex in sub_shapes(ta.TopAbs_VERTEX)
+            )
+        )
+
+        # Edges and faces are recorded by the parameters of their underlying curve or
+        # surface, the range of parameters they span and their tolerance
+        edge_records = []
+        for edge in sub_shapes(ta.TopAbs_EDGE):
+            edge = TopoDS.Edge_s(edge)
+            if BRep_Tool.Degenerated_s(edge):
+                edge_records.append("DEGENERATED")
+                continue
+            curve = BRepAdaptor_Curve(edge)
+            edge_records.append(
+                f"{geom_LUT_EDGE[curve.GetType()]}:{curve_geometry(curve)}|"
+                f"{rounded(curve.FirstParameter(), curve.LastParameter())}|"
+                f"{rounded(BRep_Tool.Tolerance_s(edge))}"
+            )
+        records.extend(sorted(edge_records))
+
+        face_records = []
+        for face in sub_shapes(ta.TopAbs_FACE):
+            face = TopoDS.Face_s(face)
+            surface = BRepAdaptor_Surface(face)
+            face_records.append(
+                f"{geom_LUT_FACE[surface.GetType()]}:{surface_geometry(surface)}|"
+                f"{rounded(*BRepTools.UVBounds_s(face))}|"
+                f"{rounded(BRep_Tool.Tolerance_s(face))}|{face.Orientation().name}"
+            )
+        records.extend(sorted(face_records))
+
+        return hashlib.sha256("\n".join(records).encode()).hexdigest()
+
     def is_null(self) -> bool:
         """Returns true if this shape is null. In other words, it references no
         underlying shape with the potential to be given a location and an
@@ -1639,16 +2527,29 @@ class Shape(NodeMixin):
         """
         return BRepCheck_Analyzer(self.wrapped).IsValid()
 
-    def bounding_box(self, tolerance: float = None) -> BoundBox:
+    def bounding_box(self, tolerance: float = None, optimal: bool = True) -> BoundBox:
         """Create a bounding box for this Shape.
 
         Args:
             tolerance (float, optional): Defaults to None.
+            optimal (bool, optional): find the tightest box, otherwise a slightly larger
+                box that still contains the Shape is found much faster. Defaults to True.
 
         Returns:
             BoundBox: A box sized to contain this Shape
         """
-        return BoundBox._from_topo_ds(self.wrapped, tolerance=tolerance)
+        bbox = Shape.property_cache.get(
+            self.wrapped,
+            f"bounding_box({tolerance}, {optimal})",
+            lambda: BoundBox._from_topo_ds(
+                self.wrapped, tolerance=tolerance, optimal=optimal
+            ).wrapped,
+        )
+        # BoundBox is mutable so always return a new one
+        x_min, y_min, z_min, x_max, y_max, z_max = bbox.Get()
+        return BoundBox(
+            Bnd_Box(gp_Pnt(x_min, y_min, z_min), gp_Pnt(x_max, y_max, z_max))
+        )
 
     def mirror(self, mirror_plane: Plane = None) -> Shape:
         """
@@ -1689,9 +2590,11 @@ class Shape(NodeMixin):
             Vector: center of multiple objects
         """
         if center_of == CenterOf.MASS:
-            total_mass = sum(Shape.compute_mass(o) for o in objects)
+            masses = [Shape.compute_mass(o) for o in objects]
+            total_mass = sum(masses)
             weighted_centers = [
-                o.center(CenterOf.MASS).multiply(Shape.compute_mass(o)) for o in objects
+                o.center(CenterOf.MASS).multiply(mass)
+                for o, mass in zip(objects, masses)
             ]
 
             sum_wc = weighted_centers[0]
@@ -1726,51 +2629,97 @@ class Shape(NodeMixin):
         Returns:
 
         """
-        properties = GProp_GProps()
         calc_function = shape_properties_LUT[shapetype(obj.wrapped)]
 
         if not calc_function:
             raise NotImplementedError
 
-        calc_function(obj.wrapped, properties)
-        return properties.Mass()
+        return obj._mass_properties(calc_function)[0]
+
+    def _mass_properties(
+        self, calc_function: Callable[[TopoDS_Shape, GProp_GProps], None]
+    ) -> tuple[float, Vector]:
+        """Mass and center of mass of this Shape
+
+        Args:
+            calc_function (Callable[[TopoDS_Shape, GProp_GProps], None]): one of the
+                BRepGProp Linear/Surface/VolumeProperties_s functions
+
+        Returns:
+            tuple[float, Vector]: mass (length, area or volume) and center of mass
+        """
+
+        def compute() -> tuple[float, tuple[float, float, float]]:
+            properties = GProp_GProps()
+            calc_function(self.wrapped, properties)
+            return properties.Mass(), properties.CentreOfMass().Coord()
+
+        mass, center = Shape.property_cache.get(
+            self.wrapped, calc_function.__name__, compute
+        )
+        return mass, Vector(center)
 
     def shape_type(self) -> Shapes:
         """Return the shape type string for this class"""
         return tcast(Shapes, shape_LUT[shapetype(self.wrapped)])
 
     def _entities(self, topo_type: Shapes) -> list[TopoDS_Shape]:
-        out = {}  # using dict to prevent duplicates
+        index = self._topology_index
+        if index is not None:
+            index.validate(self.wrapped)
+            if topo_type in index.entities:
+                return list(index.entities[topo_type])
+
+        out: list[TopoDS_Shape] = []
+        # Positions in out by hash code, used to prevent pseudo-duplicate entities.
+        # Different shapes can share a hash code so only IsSame entities match.
+        buckets: dict[int, list[int]] = {}
 
         explorer = TopExp_Explorer(self.wrapped, inverse_shape_LUT[topo_type])
 
         while explorer.More():
             item = explorer.Current()
-            out[
-                item.HashCode(HASH_CODE_MAX)
-            ] = item  # needed to avoid pseudo-duplicate entities
+            bucket = buckets.setdefault(item.HashCode(HASH_CODE_MAX), [])
+            for position in bucket:
+                if out[position].IsSame(item):
+                    out[position] = item
+                    break
+            else:
+                bucket.append(len(out))
+                out.append(item)
             explorer.Next()
 
-        return list(out.values())
+        if index is not None:
+            index.entities[topo_type] = list(out)
+
+        return out
 
     def _entities_from(
         self, child_type: Shapes, parent_type: Shapes
     ) -> Dict[Shape, list[Shape]]:
-        res = TopTools_IndexedDataMapOfShapeListOfShape()
-
-        TopTools_IndexedDataMapOfShapeListOfShape()
-        TopExp.MapShapesAndAncestors_s(
-            self.wrapped,
-            inverse_shape_LUT[child_type],
-            inverse_shape_LUT[parent_type],
-            res,
-        )
+        index = self._topology_index
+        if index is not None:
+            index.validate(self.wrapped)
+        if index is not None and (child_type, parent_type) in index.ancestors:
+            ancestors = index.ancestors[(child_type, parent_type)]
+        else:
+            res = TopTools_IndexedDataMapOfShapeListOfShape()
+            TopExp.MapShapesAndAncestors_s(
+                self.wrapped,
+                inverse_shape_LUT[child_type],
+                inverse_shape_LUT[parent_type],
+                res,
+            )
+            ancestors = [
+                (res.FindKey(i), list(res.FindFromIndex(i)))
+                for i in range(1, res.Extent() + 1)
+            ]
+            if index is not None:
+                index.ancestors[(child_type, parent_type)] = ancestors
 
         out: Dict[Shape, list[Shape]] = {}
-        for i in range(1, res.Extent() + 1):
-            out[Shape.cast(res.FindKey(i))] = [
-                Shape.cast(el) for el in res.FindFromIndex(i)
-            ]
+        for key, parents in ancestors:
+            out[Shape.cast(key)] = [Shape.cast(el) for el in parents]
 
         return out
 
@@ -1812,10 +2761,7 @@ class Shape(NodeMixin):
     @property
     def area(self) -> float:
         """area -the surface area of all faces in this Shape"""
-        properties = GProp_GProps()
-        BRepGProp.SurfaceProperties_s(self.wrapped, properties)
-
-        return properties.Mass()
+        return self._mass_properties(BRepGProp.SurfaceProperties_s)[0]
 
     @property
     def volume(self) -> float:
@@ -1834,11 +2780,12 @@ class Shape(NodeMixin):
         Returns:
             Shape: copy of transformed Shape
         """
-        shape_copy: Shape = copy.deepcopy(self, None)
-        transformed_shape = BRepBuilderAPI_Transform(
-            shape_copy.wrapped, transformation, True
-        ).Shape()
-        shape_copy.wrapped = downcast(transformed_shape)
+        transformed_shape = downcast(
+            BRepBuilderAPI_Transform(self.wrapped, transformation, True).Shape()
+        )
+        # The transformed shape replaces the wrapped object in the copy so it isn't
+        # copied only to be discarded
+        shape_copy: Shape = copy.deepcopy(self, {id(self.wrapped): transformed_shape})
         return shape_copy
 
     def rotate(self, axis: Axis, angle: float) -> Shape:
@@ -1888,15 +2835,84 @@ class Shape(NodeMixin):
 
         return self._apply_transform(transformation)
 
+    def __getstate__(self) -> dict:
+        """Return the state of self for pickling
+
+        The wrapped OCCT TopoDS_Shape is stored as compact binary BREP data, all other
+        attributes (label, color, joints, assembly structure, etc.) are pickled as is.
+        The wrapped object of an assembly built from its children only stores its
+        location and orientation and is rebuilt from the children when unpickled,
+        so the geometry is stored once and remains shared with the children.
+        """
+        state = self.__dict__.copy()
+        if self._is_built_from_children():
+            state["wrapped"] = (
+                Location(self.wrapped.Location()),
+                self.wrapped.Orientation(),
+            )
+        elif self.wrapped is not None:
+            brep_data = BytesIO()
+            self.export_brep(brep_data, binary=True, triangulation=False)
+            state["wrapped"] = brep_data.getvalue()
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore the state of self from pickled data"""
+        wrapped = state.get("wrapped")
+        if isinstance(wrapped, bytes):
+            shape = TopoDS_Shape()
+            BinTools.Read_s(shape, BytesIO(wrapped))
+            state["wrapped"] = downcast(shape)
+        elif wrapped is not None:
+            state["wrapped"] = None
+            state["_pickled_placement"] = wrapped
+        self.__dict__.update(state)
+        # Children and parents can be unpickled in either order, rebuild once all of
+        # the children are restored
+        self._rebuild_from_children()
+
+    def _is_built_from_children(self) -> bool:
+        """Is the wrapped object a compound of exactly the children's wrapped objects"""
+        children = self.__dict__.get("_NodeMixin__children")
+        if self.wrapped is None or not children:
+            return False
+        sub_shapes = []
+        iterator = TopoDS_Iterator(self.wrapped, False, False)
+        while iterator.More():
+            sub_shapes.append(iterator.Value())
+            iterator.Next()
+        return len(sub_shapes) == len(children) and all(
+            child.wrapped is not None and sub_shape.IsEqual(child.wrapped)
+            for sub_shape, child in zip(sub_shapes, children)
+        )
+
+    def _rebuild_from_children(self):
+        """Rebuild an unpickled assembly from its children once they're restored"""
+        placement = self.__dict__.get("_pickled_placement")
+        if placement is not None:
+            children = self.__dict__.get("_NodeMixin__children", [])
+            if any(child.__dict__.get("wrapped") is None for child in children):
+                return
+            location, orientation = placement
+            compound = Compound._make_compound([child.wrapped for child in children])
+            compound.Location(location.wrapped)
+            compound.Orientation(orientation)
+            self.wrapped = compound
+            del self.__dict__["_pickled_placement"]
+        parent = self.__dict__.get("_NodeMixin__parent")
+        if parent is not None and "_pickled_placement" in parent.__dict__:
+            parent._rebuild_from_children()
+
     def __deepcopy__(self, memo) -> Shape:
         """Return deepcopy of self"""
-        # The wrapped object is a OCCT TopoDS_Shape which can't be pickled or copied
-        # with the standard python copy/deepcopy, so create a deepcopy 'memo' with this
-        # value already copied which causes deepcopy to skip it.
+        # The wrapped object is a OCCT TopoDS_Shape which can't be copied with the
+        # standard python copy/deepcopy, so create a deepcopy 'memo' with this value
+        # already copied which causes deepcopy to skip it.
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        memo[id(self.wrapped)] = downcast(BRepBuilderAPI_Copy(self.wrapped).Shape())
+        if id(self.wrapped) not in memo:
+            memo[id(self.wrapped)] = downcast(BRepBuilderAPI_Copy(self.wrapped).Shape())
         for key, value in self.__dict__.items():
             setattr(result, key, copy.deepcopy(value, memo))
         return result
@@ -1912,9 +2928,20 @@ class Shape(NodeMixin):
 
         Changes to the CAD structure of the base object will be reflected in all instances.
         """
-        reference = copy.deepcopy(self)
-        reference.wrapped.TShape(self.wrapped.TShape())
-        return reference
+        # Only the Python attributes are copied, the wrapped objects of self and any
+        # assembly children are replaced by new handles to the same TShapes (each with
+        # their own Location) so no BRep copies are made
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo = {id(self): result}
+        for node in PreOrderIter(self):
+            if node.wrapped is not None:
+                memo[id(node.wrapped)] = downcast(
+                    node.wrapped.Located(node.wrapped.Location())
+                )
+        for key, value in self.__dict__.items():
+            setattr(result, key, copy.deepcopy(value, memo))
+        return result
 
     def copy(self) -> Shape:
         """Here for backwards compatibility with cq-editor"""
@@ -1941,8 +2968,7 @@ class Shape(NodeMixin):
         transformed = Shape.cast(
             BRepBuilderAPI_Transform(self.wrapped, t_matrix.wrapped.Trsf()).Shape()
         )
-        new_shape = copy.deepcopy(self, None)
-        new_shape.wrapped = transformed.wrapped
+        new_shape = copy.deepcopy(self, {id(self.wrapped): transformed.wrapped})
 
         return new_shape
 
@@ -1966,8 +2992,7 @@ class Shape(NodeMixin):
         transformed = Shape.cast(
             BRepBuilderAPI_GTransform(self.wrapped, t_matrix.wrapped, True).Shape()
         )
-        new_shape = copy.deepcopy(self, None)
-        new_shape.wrapped = transformed.wrapped
+        new_shape = copy.deepcopy(self, {id(self.wrapped): transformed.wrapped})
 
         return new_shape
 
@@ -2000,6 +3025,25 @@ class Shape(NodeMixin):
         shape_copy.wrapped.Location(loc.wrapped)
         return shape_copy
 
+    def located_ref(self, loc: Location) -> Shape:
+        """located_ref
+
+        Apply a location in absolute sense to a reference of self. Unlike
+        :meth:`located` the BRep isn't copied, the result shares the underlying
+        TopoDS_TShape with self and only the Python attributes are copied.
+
+        Changes to the CAD structure of the result will be reflected in self.
+
+        Args:
+            loc (Location): new absolute location
+
+        Returns:
+            Shape: reference to Shape at location
+        """
+        shape_ref: Shape = copy.copy(self)
+        shape_ref.wrapped.Location(loc.wrapped)
+        return shape_ref
+
     def move(self, loc: Location) -> Shape:
         """Apply a location in relative sense (i.e. update current location) to self
 
@@ -2029,6 +3073,26 @@ class Shape(NodeMixin):
         shape_copy.wrapped = downcast(shape_copy.wrapped.Moved(loc.wrapped))
         return shape_copy
 
+    def moved_ref(self, loc: Location) -> Shape:
+        """moved_ref
+
+        Apply a location in relative sense (i.e. update current location) to a
+        reference of self. Unlike :meth:`moved` the BRep isn't copied, the result
+        shares the underlying TopoDS_TShape with self and only the Python attributes
+        are copied.
+
+        Changes to the CAD structure of the result will be reflected in self.
+
+        Args:
+            loc (Location): new location relative to current location
+
+        Returns:
+            Shape: reference to Shape moved to relative location
+        """
+        shape_ref: Shape = copy.copy(self)
+        shape_ref.wrapped = downcast(shape_ref.wrapped.Moved(loc.wrapped))
+        return shape_ref
+
     def distance_to_with_closest_points(
         self, other: Union[Shape, VectorLike]
     ) -> tuple[float, Vector, Vector]:
@@ -2226,62 +3290,187 @@ class Shape(NodeMixin):
 
             yield dist_calc.Value()
 
-    def mesh(self, tolerance: float, angular_tolerance: float = 0.1):
+    def mesh(
+        self, tolerance: float, angular_tolerance: float = 0.1, parallel: bool = False
+    ):
         """Generate triangulation if none exists.
 
         Args:
           tolerance: float:
           angular_tolerance: float:  (Default value = 0.1)
+          parallel: bool: mesh the faces on OCCT's worker threads, which only
+            helps shapes with many faces on a multi-core machine
+            (Default value = False)
 
         Returns:
 
         """
 
         if not BRepTools.Triangulation_s(self.wrapped, tolerance):
-            BRepMesh_IncrementalMesh(self.wrapped, tolerance, True, angular_tolerance)
+            BRepMesh_IncrementalMesh(
+                self.wrapped, tolerance, True, angular_tolerance, parallel
+            )
 
     def tessellate(
-        self, tolerance: float, angular_tolerance: float = 0.1
+        self,
+        tolerance: float,
+        angular_tolerance: float = 0.1,
+        parallel: bool = False,
+        weld_tolerance: float = None,
     ) -> Tuple[list[Vector], list[Tuple[int, int, int]]]:
-        """General triangulated approximation"""
-        self.mesh(tolerance, angular_tolerance)
+        """General triangulated approximation
+
+        Args:
+            tolerance (float): linear tolerance for tessellation
+            angular_tolerance (float, optional): angular tolerance for tessellation.
+                Defaults to 0.1.
+            parallel (bool, optional): mesh the faces on OCCT's worker threads.
+                Defaults to False.
+            weld_tolerance (float, optional): merge vertices closer than this
+                distance. Defaults to None (no welding).
+
+        Returns:
+            Tuple[list[Vector], list[Tuple[int, int, int]]]: vertices and triangle
+                vertex indices
+        """
+        vertices, triangles = self.tessellate_arrays(
+            tolerance, angular_tolerance, parallel, weld_tolerance
+        )
 
-        vertices: list[Vector] = []
-        triangles: list[Tuple[int, int, int]] = []
+        return [Vector(*v) for v in vertices.tolist()], [
+            tuple(t) for t in triangles.tolist()
+        ]
+
+    def tessellate_arrays(
+        self,
+        tolerance: float,
+        angular_tolerance: float = 0.1,
+        parallel: bool = False,
+        weld_tolerance: float = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Triangulated approximation as NumPy arrays
+
+        Equivalent to :meth:`tessellate` but the mesh is returned as contiguous arrays
+        without creating a Python object per vertex or triangle, which is much faster
+        for large meshes.
+
+        Args:
+            tolerance (float): linear tolerance for tessellation
+            angular_tolerance (float, optional): angular tolerance for tessellation.
+                Defaults to 0.1.
+            parallel (bool, optional): mesh the faces on OCCT's worker threads.
+                Defaults to False.
+            weld_tolerance (float, optional): merge vertices closer than this
+                distance, which faces duplicate along their shared edges, into a
+                watertight mesh. Defaults to None (no welding).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: float64 (N,3) vertex positions and int32
+                (M,3) triangle vertex indices
+        """
+        cache = Shape.tessellation_cache
+        tessellation = None
+        if cache is not None:
+            key = cache.key(self, tolerance, angular_tolerance)
+            tessellation = cache.get(key)
+        if tessellation is None:
+            tessellation = self._tessellate_faces(
+                tolerance, angular_tolerance, parallel
+            )
+            if cache is not None:
+                cache.put(key, tessellation)
+
+        vertices, triangles = tessellation
+        if weld_tolerance is not None and len(vertices):
+            vertices, triangles = Shape._weld_vertices(
+                vertices, triangles, weld_tolerance
+            )
+        return vertices, triangles
+
+    def _tessellate_faces(
+        self, tolerance: float, angular_tolerance: float, parallel: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Mesh the shape and combine the triangulations of all of its faces"""
+        self.mesh(tolerance, angular_tolerance, parallel)
+
+        vertex_arrays: list[np.ndarray] = []
+        triangle_arrays: list[np.ndarray] = []
         offset = 0
 
         for face in self.faces():
-            loc = TopLoc_Location()
-            poly = BRep_Tool.Triangulation_s(face.wrapped, loc)
-            trsf = loc.Transformation()
-            reverse = face.wrapped.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
+            face_vertices, face_triangles = Shape._triangulation_arrays(face.wrapped)
+            vertex_arrays.append(face_vertices)
+            triangle_arrays.append(face_triangles + offset)
+            offset += len(face_vertices)
 
-            # add vertices
-            vertices += [
-                Vector(v.X(), v.Y(), v.Z())
-                for v in (
-                    poly.Node(i).Transformed(trsf) for i in range(1, poly.NbNodes() + 1)
-                )
-            ]
-            # add triangles
-            triangles += [
-                (
-                    t.Value(1) + offset - 1,
-                    t.Value(3) + offset - 1,
-                    t.Value(2) + offset - 1,
-                )
-                if reverse
-                else (
-                    t.Value(1) + offset - 1,
-                    t.Value(2) + offset - 1,
-                    t.Value(3) + offset - 1,
-                )
-                for t in poly.Triangles()
-            ]
+        if not vertex_arrays:
+            return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int32)
 
-            offset += poly.NbNodes()
+        return np.concatenate(vertex_arrays), np.concatenate(triangle_arrays)
 
-        return vertices, triangles
+    @staticmethod
+    def _weld_vertices(
+        vertices: np.ndarray, triangles: np.ndarray, tolerance: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Merge vertices that are closer than tolerance
+
+        Vertices within tolerance of each other are grouped (transitively) and the
+        first vertex of each group is kept, in its original order. Triangles that
+        collapse to a line or point are removed.
+        """
+        if tolerance <= 0:
+            raise ValueError("weld_tolerance must be positive")
+        pairs = cKDTree(vertices).query_pairs(tolerance, output_type="ndarray")
+        graph = coo_matrix(
+            (np.ones(len(pairs), dtype=np.int8), (pairs[:, 0], pairs[:, 1])),
+            shape=(len(vertices), len(vertices)),
+        )
+        _, groups = connected_components(graph, directed=False)
+        _, first, inverse = np.unique(groups, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        new_index = np.empty_like(order)
+        new_index[order] = np.arange(len(order))
+
+        triangles = new_index[inverse.reshape(-1)][triangles].astype(np.int32)
+        valid = (
+            (triangles[:, 0] != triangles[:, 1])
+            & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 2] != triangles[:, 0])
+        )
+        return vertices[first[order]], np.ascontiguousarray(triangles[valid])
+
+    @staticmethod
+    def _triangulation_arrays(face: TopoDS_Face) -> Tuple[np.ndarray, np.ndarray]:
+        """Extract the existing triangulation of an OCCT face as NumPy arrays
+
+        The face location is applied to all nodes with a single matrix multiply and
+        the triangle winding is reversed for reversed faces.
+        """
+        loc = TopLoc_Location()
+        poly = BRep_Tool.Triangulation_s(face, loc)
+        if poly is None:
+            return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int32)
+
+        nodes = np.array(
+            [poly.Node(i).Coord() for i in range(1, poly.NbNodes() + 1)],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        if not loc.IsIdentity():
+            trsf = loc.Transformation()
+            matrix = np.array(
+                [[trsf.Value(row, col) for col in range(1, 5)] for row in range(1, 4)]
+            )
+            nodes = nodes @ matrix[:, :3].T + matrix[:, 3]
+
+        triangles = np.array(
+            [poly.Triangle(i).Get() for i in range(1, poly.NbTriangles() + 1)],
+            dtype=np.int32,
+        ).reshape(-1, 3)
+        triangles -= 1
+        if face.Orientation() == TopAbs_Orientation.TopAbs_REVERSED:
+            triangles = triangles[:, [0, 2, 1]]
+
+        return np.ascontiguousarray(nodes), np.ascontiguousarray(triangles)
 
     def to_splines(
         self, degree: int = 3, tolerance: float = 1e-3, nurbs: bool = False
@@ -2538,6 +3727,26 @@ class ShapeList(list[T]):
         """Last element in the ShapeList"""
         return self[-1]
 
+    def _axis_positions(self, axis: Axis) -> np.ndarray:
+        """Position of each object's center along axis
+
+        The centers are found once and projected onto the axis with a single
+        dot product, matching the local Z coordinate of the center in
+        ``axis.to_plane()``.
+
+        Args:
+            axis (Axis): axis to project onto
+
+        Returns:
+            np.ndarray: signed distance of each center from the axis position
+        """
+        centers = np.array(
+            [obj.center().to_tuple() for obj in self], dtype=np.float64
+        ).reshape(-1, 3)
+        origin = np.array(axis.position.to_tuple())
+        direction = np.array(axis.direction.to_tuple())
+        return (centers - origin) @ direction
+
     def filter_by(
         self,
         filter_by: Union[Axis, GeomType],
@@ -2627,36 +3836,12 @@ class ShapeList(list[T]):
         Returns:
             ShapeList: filtered object list
         """
-        if inclusive == (True, True):
-            objects = filter(
-                lambda o: minimum
-                <= axis.to_plane().to_local_coords(o).center().Z
-                <= maximum,
-                self,
-            )
-        elif inclusive == (True, False):
-            objects = filter(
-                lambda o: minimum
-                <= axis.to_plane().to_local_coords(o).center().Z
-                < maximum,
-                self,
-            )
-        elif inclusive == (False, True):
-            objects = filter(
-                lambda o: minimum
-                < axis.to_plane().to_local_coords(o).center().Z
-                <= maximum,
-                self,
-            )
-        elif inclusive == (False, False):
-            objects = filter(
-                lambda o: minimum
-                < axis.to_plane().to_local_coords(o).center().Z
-                < maximum,
-                self,
-            )
-
-        return ShapeList(objects).sort_by(axis)
+        positions = self._axis_positions(axis)
+        above_min = positions >= minimum if inclusive[0] else positions > minimum
+        below_max = positions <= maximum if inclusive[1] else positions < maximum
+        selected = np.flatnonzero(above_min & below_max)
+        order = sorted(selected, key=lambda i: positions[i])
+        return ShapeList(self[i] for i in order)
 
     def group_by(
         self, group_by: Union[Axis, SortBy] = Axis.Z, reverse=False, tol_digits=6
@@ -2676,9 +3861,11 @@ class ShapeList(list[T]):
             List[ShapeList]: sorted list of ShapeLists
         """
         groups = {}
-        for obj in self:
+        if isinstance(group_by, Axis):
+            positions = self._axis_positions(group_by)
+        for i, obj in enumerate(self):
             if isinstance(group_by, Axis):
-                key = group_by.to_plane().to_local_coords(obj).center().Z
+                key = float(positions[i])
 
             elif isinstance(group_by, SortBy):
                 if group_by == SortBy.LENGTH:
@@ -2727,11 +3914,11 @@ class ShapeList(list[T]):
             ShapeList: sorted list of objects
         """
         if isinstance(sort_by, Axis):
-            objects = sorted(
-                self,
-                key=lambda o: sort_by.to_plane().to_local_coords(o).center().Z,
-                reverse=reverse,
+            positions = self._axis_positions(sort_by)
+            order = sorted(
+                range(len(self)), key=lambda i: positions[i], reverse=reverse
             )
+            objects = [self[i] for i in order]
 
         elif isinstance(sort_by, SortBy):
             if sort_by == SortBy.LENGTH:
@@ -2877,11 +4064,9 @@ class Compound(Shape, Mixin3D):
         if center_of == CenterOf.GEOMETRY:
             raise ValueError("Center of GEOMETRY is not supported for this object")
         if center_of == CenterOf.MASS:
-            properties = GProp_GProps()
             calc_function = shape_properties_LUT[shapetype(self.wrapped)]
             if calc_function:
-                calc_function(self.wrapped, properties)
-                middle = Vector(properties.CentreOfMass())
+                middle = self._mass_properties(calc_function)[1]
             else:
                 raise NotImplementedError
         elif center_of == CenterOf.BOUNDING_BOX:
@@ -2905,6 +4090,9 @@ class Compound(Shape, Mixin3D):
         """
         comp_builder = TopoDS_Builder()
         comp_builder.Remove(self.wrapped, shape.wrapped)
+        # The TShape has been modified in place so any cached data is invalid
+        Shape.property_cache.invalidate(self)
+        _TopologyIndex.modified(self.wrapped)
         return self
 
     def _post_detach(self, parent: Compound):
@@ -2966,38 +4154,68 @@ class Compound(Shape, Mixin3D):
         Returns:
             bool: do the object intersect
         """
+        for child_a, child_b, common_volume in self._intersecting_children(
+            include_parent, tolerance
+        ):
+            return (True, (child_a, child_b), common_volume)
+        return (False, (None, None), None)
+
+    def intersecting_children(
+        self, include_parent: bool = False, tolerance: float = 1e-5
+    ) -> list[tuple[Shape, Shape, float]]:
+        """Intersecting Children
+
+        Find all of the pairs of child objects within a Compound/assembly that
+        share a common volume.
+
+        Args:
+            include_parent (bool, optional): check parent for intersections. Defaults to False.
+            tolerance (float, optional): maximum allowable volume difference. Defaults to 1e-5.
+
+        Returns:
+            list[tuple[Shape, Shape, float]]: intersecting pairs and their common volume
+        """
+        return list(self._intersecting_children(include_parent, tolerance))
+
+    def _intersecting_children(
+        self, include_parent: bool, tolerance: float
+    ) -> Iterator[tuple[Shape, Shape, float]]:
+        """Generate the intersecting pairs of children
+
+        Bounding boxes are compared numerically with a sweep along X so only
+        pairs whose boxes overlap by more than tolerance are intersected, which
+        could be complex. Pairs are generated in child order.
+        """
         children: list[Shape] = list(PreOrderIter(self))
         if not include_parent:
             children.pop(0)  # remove parent
-        # children_bbox = [child.bounding_box().to_solid() for child in children]
-        children_bbox = [
-            Solid.from_bounding_box(child.bounding_box()) for child in children
-        ]
-        child_index_pairs = [
-            tuple(map(int, comb))
-            for comb in combinations(list(range(len(children))), 2)
-        ]
-        for child_index_pair in child_index_pairs:
-            # First check for bounding box intersections ..
-            # .. then confirm with actual object intersections which could be complex
-            bbox_common_volume = (
-                children_bbox[child_index_pair[0]]
-                .intersect(children_bbox[child_index_pair[1]])
-                .volume
+        if len(children) < 2:
+            return
+
+        boxes = [child.bounding_box(optimal=False) for child in children]
+        mins = np.array([bbox.min.to_tuple() for bbox in boxes])
+        maxs = np.array([bbox.max.to_tuple() for bbox in boxes])
+
+        # Sweep and prune: only boxes that start before this one ends can overlap
+        order = np.argsort(mins[:, 0], kind="stable")
+        sorted_min_x = mins[order, 0]
+        candidate_pairs = []
+        for position, index in enumerate(order):
+            end = np.searchsorted(sorted_min_x, maxs[index, 0], side="right")
+            others = order[position + 1 : end]
+            if not others.size:
+                continue
+            extents = np.minimum(maxs[index], maxs[others]) - np.maximum(
+                mins[index], mins[others]
             )
-            if bbox_common_volume > tolerance:
-                common_volume = (
-                    children[child_index_pair[0]]
-                    .intersect(children[child_index_pair[1]])
-                    .volume
-                )
-                if common_volume > tolerance:
-                    return (
-                        True,
-                        (children[child_index_pair[0]], children[child_index_pair[1]]),
-                        common_volume,
-                    )
-        return (False, (None, None), None)
+            overlap_volume = np.prod(np.clip(extents, 0, None), axis=1)
+            for other in others[overlap_volume > tolerance]:
+                candidate_pairs.append((int(min(index, other)), int(max(index, other))))
+
+        for index_a, index_b in sorted(candidate_pairs):
+            common_volume = children[index_a].intersect(children[index_b]).volume
+            if common_volume > tolerance:
+                yield (children[index_a], children[index_b], common_volume)
 
     @classmethod
     def make_text(
@@ -3935,9 +5153,7 @@ class Face(Shape):
         if (center_of == CenterOf.MASS) or (
             center_of == CenterOf.GEOMETRY and self.geom_type() == "PLANE"
         ):
-            properties = GProp_GProps()
-            BRepGProp.SurfaceProperties_s(self.wrapped, properties)
-            center_point = properties.CentreOfMass()
+            center_point = self._mass_properties(BRepGProp.SurfaceProperties_s)[1]
 
         elif center_of == CenterOf.BOUNDING_BOX:
             center_point = self.bounding_box().center()
@@ -4414,7 +5630,9 @@ class Face(Shape):
             ShapeList[Face]: Face(s) projected on target object ordered by distance
         """
         max_dimension = (
-            Compound.make_compound([self, target_object]).bounding_box().diagonal
+            Compound.make_compound([self, target_object])
+            .bounding_box(optimal=False)
+            .diagonal
         )
         face_extruded = Solid.extrude_linear(
             self, Vector(direction) * max_dimension, taper=taper
@@ -4505,9 +5723,7 @@ class Shell(Shape):
 
     def center(self) -> Vector:
         """Center of mass of the shell"""
-        properties = GProp_GProps()
-        BRepGProp.LinearProperties_s(self.wrapped, properties)
-        return Vector(properties.CentreOfMass())
+        return self._mass_properties(BRepGProp.LinearProperties_s)[1]
 
 
 class Solid(Shape, Mixin3D):
@@ -4920,7 +6136,9 @@ class Solid(Shape, Mixin3D):
         direction = Vector(direction)
 
         max_dimension = (
-            Compound.make_compound([section, target_object]).bounding_box().diagonal
+            Compound.make_compound([section, target_object])
+            .bounding_box(optimal=False)
+            .diagonal
         )
         clipping_direction = (
             direction * max_dimension
@@ -5353,8 +6571,7 @@ class Wire(Shape, Mixin1D):
 
         Build a Wire from the provided unsorted Edges. If sequenced is True the
         Edges are placed in such that the end of the nth Edge is coincident with
-        the n+1th Edge forming an unbroken sequence. Note that sequencing a list
-        is relatively slow.
+        the n+1th Edge forming an unbroken sequence.
 
         Args:
             edges (Iterable[Edge]): Edges to assemble
@@ -5367,37 +6584,26 @@ class Wire(Shape, Mixin1D):
         Returns:
             Wire: assembled edges
         """
-
-        def closest_to_end(current: Wire, unplaced_edges: list[Edge]) -> Edge:
-            """Return the Edge closest to the end of last_edge"""
-            target_point = current.position_at(1)
-
-            sorted_edges = sorted(
-                unplaced_edges,
-                key=lambda e: min(
-                    (target_point - e.position_at(0)).length,
-                    (target_point - e.position_at(1)).length,
-                ),
-            )
-            return sorted_edges[0]
-
         edges = list(edges)
         if sequenced:
-            placed_edges = [edges.pop(0)]
-            unplaced_edges = edges
-
-            while unplaced_edges:
-                next_edge = closest_to_end(Wire.make_wire(placed_edges), unplaced_edges)
-                next_edge_index = unplaced_edges.index(next_edge)
-                placed_edges.append(unplaced_edges.pop(next_edge_index))
-
-            edges = placed_edges
+            edges = Wire._sequence_edges(edges)
 
         wire_builder = BRepBuilderAPI_MakeWire()
-        for edge in edges:
+        for i, edge in enumerate(edges):
             wire_builder.Add(edge.wrapped)
             if sequenced and wire_builder.Error() == BRepBuilderAPI_DisconnectedWire:
-                raise ValueError("Edges are disconnected")
+                previous_end, end = min(
+                    (
+                        (a, b)
+                        for a in (edges[i - 1].start_point(), edges[i - 1].end_point())
+                        for b in (edge.start_point(), edge.end_point())
+                    ),
+                    key=lambda ends: (ends[0] - ends[1]).length,
+                )
+                raise ValueError(
+                    f"Edges are disconnected, gap of {(end - previous_end).length:.6g}"
+                    f" between {previous_end.to_tuple()} and {end.to_tuple()}"
+                )
 
         wire_builder.Build()
         if not wire_builder.IsDone():
@@ -5408,6 +6614,65 @@ class Wire(Shape, Mixin1D):
 
         return cls(wire_builder.Wire())
 
+    @staticmethod
+    def _sequence_edges(edges: list[Edge]) -> list[Edge]:
+        """Sequence Edges
+
+        Order the edges into a chain by repeatedly adding the unplaced edge with the
+        endpoint closest to either end of the chain. Edges may be reversed. The
+        endpoints are found with a KD-tree so the chain is built in O(n log n).
+
+        Args:
+            edges (list[Edge]): edges to sequence
+
+        Returns:
+            list[Edge]: edges where each is adjacent to the next if connected
+        """
+        if len(edges) < 3:
+            return edges
+
+        # Endpoint 2 * i is the start of edges[i] and 2 * i + 1 is its end
+        endpoints = np.array(
+            [
+                point.to_tuple()
+                for edge in edges
+                for point in (edge.start_point(), edge.end_point())
+            ]
+        )
+        tree = cKDTree(endpoints)
+        placed = np.zeros(len(edges), dtype=bool)
+
+        def closest_unplaced(point: np.ndarray) -> tuple[float, int]:
+            """Distance to and index of the closest endpoint of an unplaced edge"""
+            neighbors = 4
+            while True:
+                neighbors = min(neighbors, len(endpoints))
+                distances, indices = tree.query(point, neighbors)
+                for distance, index in zip(distances, indices):
+                    if not placed[index // 2]:
+                        return distance, index
+                # All the nearest endpoints are placed, look further afield
+                neighbors *= 2
+
+        placed[0] = True
+        head, tail = [], [edges[0]]
+        head_point, tail_point = endpoints[0], endpoints[1]
+        for _ in range(len(edges) - 1):
+            tail_distance, tail_index = closest_unplaced(tail_point)
+            if tail_distance > TOLERANCE:
+                head_distance, head_index = closest_unplaced(head_point)
+                if head_distance < tail_distance:
+                    # The chain continues from the other end of this edge
+                    placed[head_index // 2] = True
+                    head.append(edges[head_index // 2])
+                    head_point = endpoints[head_index ^ 1]
+                    continue
+            placed[tail_index // 2] = True
+            tail.append(edges[tail_index // 2])
+            tail_point = endpoints[tail_index ^ 1]
+
+        return head[::-1] + tail
+
     @classmethod
     def make_circle(cls, radius: float, plane: Plane = Plane.XY) -> Wire:
         """make_circle
@@ -5665,6 +6930,9 @@ class Wire(Shape, Mixin1D):
 
         Args:
             edges (Iterable[Edge]): edges defining the convex hull
+            tolerance (float, optional): spacing of the points placed around where
+                the hull contacts the edges as a fraction of edge length.
+                Defaults to 1e-3.
 
         Raises:
             ValueError: edges overlap
@@ -5672,19 +6940,17 @@ class Wire(Shape, Mixin1D):
             Wire: convex hull perimeter
         """
         # Algorithm:
-        # 1) create a cloud of points along all edges
+        # 1) create a coarse cloud of points along all edges
         # 2) create a convex hull which returns facets/simplices as pairs of point indices
-        # 3) find facets that are within an edge but not adjacent and store trim and
+        # 3) refine the points around where the connecting facets contact the edges
+        #    and repeat 2) until the points there are tolerance apart
+        # 4) find facets that are within an edge but not adjacent and store trim and
         #    new connecting edge data
-        # 4) find facets between edges and store trim and new connecting edge data
-        # 5) post process the trim data to remove duplicates and store in pairs
-        # 6) create  connecting edges
-        # 7) create trim edges from the original edges and the trim data
-        # 8) return a wire version of all the edges
-
-        # Possible enhancement: The accuracy of the result could be improved and the
-        # execution time reduced by adaptively placing more points around where the
-        # connecting edges contact the arc.
+        # 5) find facets between edges and store trim and new connecting edge data
+        # 6) post process the trim data to remove duplicates and store in pairs
+        # 7) create  connecting edges
+        # 8) create trim edges from the original edges and the trim data
+        # 9) return a wire version of all the edges
 
         # if any(
         #     [
@@ -5694,25 +6960,83 @@ class Wire(Shape, Mixin1D):
         # ):
         #     raise ValueError("edges overlap")
 
-        fragments_per_edge = int(2 / tolerance)
-        points_lookup = {}  # lookup from point index to edge/position on edge
-        points = []  # convex hull point cloud
+        edges = list(edges)
 
-        # Create points along each edge and the lookup structure
-        for edge_index, edge in enumerate(edges):
-            for i in range(fragments_per_edge):
-                param = i / (fragments_per_edge - 1)
-                points.append(edge.position_at(param).to_tuple()[:2])
-                points_lookup[edge_index * fragments_per_edge + i] = (edge_index, param)
+        # Sample each edge uniformly by parameter, refining later where required
+        params = []
+        for edge in edges:
+            curve = edge._geom_adaptor()
+            params.append(
+                np.linspace(curve.FirstParameter(), curve.LastParameter(), 33)
+            )
+        edge_points = [edge._evaluate(p)[:, :2] for edge, p in zip(edges, params)]
+        spacing = [tolerance * edge.length / 2 for edge in edges]
 
-        convex_hull = ConvexHull(points)
+        while True:
+            points = np.concatenate(edge_points)  # convex hull point cloud
+            edge_indices = np.repeat(
+                np.arange(len(edges)), [len(p) for p in edge_points]
+            )
+            offsets = np.cumsum([0] + [len(p) for p in edge_points])
+            convex_hull = ConvexHull(points)
+
+            # Hull vertices where a facet leaves the edge are contact points
+            contacts = {
+                index
+                for simplice in convex_hull.simplices
+                if edge_indices[simplice[0]] != edge_indices[simplice[1]]
+                or abs(simplice[0] - simplice[1]) != 1
+                for index in simplice.tolist()
+            }
+            new_params = defaultdict(list)
+            for index in contacts:
+                edge_index = edge_indices[index]
+                local_index = index - offsets[edge_index]
+                edge_params = params[edge_index]
+                for neighbor in (local_index - 1, local_index + 1):
+                    if not 0 <= neighbor < len(edge_params):
+                        continue
+                    gap = edge_points[edge_index][local_index] - edge_points[
+                        edge_index
+                    ][neighbor]
+                    if np.hypot(*gap) > spacing[edge_index]:
+                        new_params[edge_index].append(
+                            np.linspace(
+                                edge_params[local_index], edge_params[neighbor], 10
+                            )[1:-1]
+                        )
+            if not new_params:
+                break
+
+            for edge_index, refinements in new_params.items():
+                refinements = np.concatenate(refinements)
+                merged_params = np.concatenate([params[edge_index], refinements])
+                merged_points = np.concatenate(
+                    [
+                        edge_points[edge_index],
+                        edges[edge_index]._evaluate(refinements)[:, :2],
+                    ]
+                )
+                order = np.argsort(merged_params, kind="stable")
+                params[edge_index] = merged_params[order]
+                edge_points[edge_index] = merged_points[order]
+
+        def points_lookup(index: int) -> tuple[int, float]:
+            """Edge index and normalized length along the edge of a hull point"""
+            edge_index = int(edge_indices[index])
+            curve = edges[edge_index]._geom_adaptor()
+            param = params[edge_index][index - offsets[edge_index]]
+            length = GCPnts_AbscissaPoint.Length_s(
+                curve, curve.FirstParameter(), param
+            )
+            return edge_index, min(max(length / edges[edge_index].length, 0.0), 1.0)
 
         # Filter the fragments
         connecting_edge_data = []
         trim_points = {}
         for simplice in convex_hull.simplices:
-            edge0 = points_lookup[simplice[0]][0]
-            edge1 = points_lookup[simplice[1]][0]
+            edge0 = int(edge_indices[simplice[0]])
+            edge1 = int(edge_indices[simplice[1]])
             # Look for connecting edges between edges
             if edge0 != edge1:
                 if not edge0 in trim_points:
@@ -5725,8 +7049,8 @@ class Wire(Shape, Mixin1D):
                     trim_points[edge1].append(simplice[1])
                 connecting_edge_data.append(
                     (
-                        (edge0, points_lookup[simplice[0]][1], simplice[0]),
-                        (edge1, points_lookup[simplice[1]][1], simplice[1]),
+                        (edge0, points_lookup(simplice[0])[1], simplice[0]),
+                        (edge1, points_lookup(simplice[1])[1], simplice[1]),
                     )
                 )
             # Look for connecting edges within an edge
@@ -5739,8 +7063,8 @@ class Wire(Shape, Mixin1D):
                     trim_points[edge0].extend([start_pnt, end_pnt])
                 connecting_edge_data.append(
                     (
-                        (edge0, points_lookup[start_pnt][1], start_pnt),
-                        (edge0, points_lookup[end_pnt][1], end_pnt),
+                        (edge0, points_lookup(start_pnt)[1], start_pnt),
+                        (edge0, points_lookup(end_pnt)[1], end_pnt),
                     )
                 )
 
@@ -5761,7 +7085,7 @@ class Wire(Shape, Mixin1D):
         ]
         trimmed_edges = [
             edges[edge].trim(
-                points_lookup[trim_pair[0]][1], points_lookup[trim_pair[1]][1]
+                points_lookup(trim_pair[0])[1], points_lookup(trim_pair[1])[1]
             )
             for edge, trim_pairs in trim_data.items()
             for trim_pair in trim_pairs
@@ -6292,6 +7616,7 @@ class ThreeMF:
         tolerance: float,
         angular_tolerance: float,
         unit: Unit = Unit.MILLIMETER,
+        parallel: bool = False,
     ):
         """
         Initialize the writer.
@@ -6304,9 +7629,19 @@ class ThreeMF:
         else:
             shapes = [shape]
 
-        tessellations = [s.tessellate(tolerance, angular_tolerance) for s in shapes]
+        # The children are meshed one after another, parallel only spreads the faces
+        # of each child across OCCT's threads. Meshing the whole compound in one
+        # pass isn't used as it gives the children coarser meshes than meshing them
+        # individually.
+        # Merge the vertices shared by faces so the meshes are watertight
+        tessellations = [
+            s.tessellate_arrays(
+                tolerance, angular_tolerance, parallel, weld_tolerance=TOLERANCE
+            )
+            for s in shapes
+        ]
         # Remove shapes that did not tesselate
-        self.tessellations = [t for t in tessellations if all(t)]
+        self.tessellations = [t for t in tessellations if len(t[0]) and len(t[1])]
 
     def write_3mf(self, file_name: str):
         """
@@ -6320,81 +7655,71 @@ class ThreeMF:
         except ImportError:
             compression = ZIP_STORED
 
+        # The model is streamed so its size isn't known in advance
+        model_size = sum(
+            96 * len(vertices) + 64 * len(triangles)
+            for vertices, triangles in self.tessellations
+        )
         with ZipFile(file_name, "w", compression) as zf:
             zf.writestr("_rels/.rels", self._write_relationships())
             zf.writestr("[Content_Types].xml", self._write_content_types())
-            zf.writestr("3D/3dmodel.model", self._write_3d())
+            with zf.open(
+                "3D/3dmodel.model", "w", force_zip64=model_size > ZIP64_LIMIT
+            ) as model_file:
+                self._write_3d(model_file)
 
-    def _write_3d(self) -> str:
+    def _write_3d(self, stream: IO[bytes]):
+        """Stream the model XML, formatting the mesh data in large chunks"""
         no_meshes = len(self.tessellations)
 
-        model = ET.Element(
-            "model",
-            {
-                "xml:lang": "en-US",
-                "xmlns": ThreeMF.SCHEMAS.CORE,
-            },
-            unit=self.unit,
+        stream.write(
+            (
+                "<?xml version='1.0' encoding='utf-8'?>\n"
+                f'<model xml:lang="en-US" xmlns="{ThreeMF.SCHEMAS.CORE}" '
+                f'unit="{self.unit}">'
+                '<metadata name="Application">Build123d 3MF Exporter</metadata>'
+                f'<metadata name="CreationDate">{datetime.now().isoformat()}</metadata>'
+                "<resources>"
+            ).encode()
         )
 
-        # Add meta data
-        ET.SubElement(
-            model, "metadata", name="Application"
-        ).text = "Build123d 3MF Exporter"
-        ET.SubElement(
-            model, "metadata", name="CreationDate"
-        ).text = datetime.now().isoformat()
-
-        resources = ET.SubElement(model, "resources")
-
         # Add all meshes to resources
         for i, tessellation in enumerate(self.tessellations):
-            self._add_mesh(resources, str(i), tessellation)
-
-        # Create a component of all meshes
-        comp_object = ET.SubElement(
-            resources,
-            "object",
-            id=str(no_meshes),
-            name=f"Build123d Component",
-            type="model",
+            self._add_mesh(stream, str(i), tessellation)
+
+        # Create a component of all meshes and add it to the build
+        components = "".join(f'<component objectid="{i}" />' for i in range(no_meshes))
+        stream.write(
+            (
+                f'<object id="{no_meshes}" name="Build123d Component" type="model">'
+                f"<components>{components}</components></object>"
+                "</resources>"
+                f'<build><item objectid="{no_meshes}" /></build>'
+                "</model>"
+            ).encode()
         )
-        components = ET.SubElement(comp_object, "components")
-
-        # Add all meshes to the component
-        for i in range(no_meshes):
-            ET.SubElement(
-                components,
-                "component",
-                objectid=str(i),
-            )
-
-        # Add the component to the build
-        build = ET.SubElement(model, "build")
-        ET.SubElement(build, "item", objectid=str(no_meshes))
-
-        return ET.tostring(model, xml_declaration=True, encoding="utf-8")
 
+    @staticmethod
     def _add_mesh(
-        self,
-        to: ET.Element,
+        stream: IO[bytes],
         id: str,
-        tessellation: tuple[list[Vector], list[tuple[int, int, int]]],
+        tessellation: tuple[np.ndarray, np.ndarray],
+        chunk_size: int = 65536,
     ):
-        object = ET.SubElement(
-            to, "object", id=id, name=f"CadQuery Shape {id}", type="model"
+        stream.write(
+            f'<object id="{id}" name="CadQuery Shape {id}" type="model"><mesh>'.encode()
         )
-        mesh = ET.SubElement(object, "mesh")
-
-        # add vertices
-        vertices = ET.SubElement(mesh, "vertices")
-        for v in tessellation[0]:
-            ET.SubElement(vertices, "vertex", x=str(v.X), y=str(v.Y), z=str(v.Z))
-
-        # add triangles
-        volume = ET.SubElement(mesh, "triangles")
-        for t in tessellation[1]:
-            ET.SubElement(volume, "triangle", v1=str(t[0]), v2=str(t[1]), v3=str(t[2]))
+        vertices, triangles = tessellation
+        for tag, rows, template in [
+            ("vertices", vertices, '<vertex x="%.9g" y="%.9g" z="%.9g" />'),
+            ("triangles", triangles, '<triangle v1="%d" v2="%d" v3="%d" />'),
+        ]:
+            stream.write(f"<{tag}>".encode())
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size].ravel().tolist()
+                stream.write((template * (len(chunk) // 3) % tuple(chunk)).encode())
+            stream.write(f"</{tag}>".encode())
+        stream.write(b"</mesh></object>")
 
     def _write_content_types(self) -> str:
         root = ET.Element("Types")
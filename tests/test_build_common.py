@@ -26,6 +26,8 @@ license:
 
 """
 import unittest
+
+import numpy as np
 from build123d import *
 from build123d import Builder, WorkplaneList, LocationList
 
@@ -518,6 +520,44 @@ class TestLocations(unittest.TestCase):
         self.assertTupleAlmostEquals(ort[10], (-0.00, 0.00, -120.00), 2)
         self.assertTupleAlmostEquals(ort[11], (-0.00, 0.00, -120.00), 2)
 
+    def test_location_array(self):
+        with BuildPart(Plane.XY, Plane.XY.offset(1)) as test:
+            with GridLocations(1, 1, 10, 10) as grid:
+                self.assertIsInstance(grid.local_locations, list)
+                self.assertIsInstance(grid.locations[0], Location)
+                self.assertIsInstance(grid.local_location_array, LocationArray)
+                self.assertEqual(len(grid.locations), 200)
+                self.assertEqual(len(grid.location_array), 200)
+                self.assertEqual(len(list(grid)), 200)
+            inside = grid.local_location_array[
+                np.linalg.norm(grid.local_location_array.positions, axis=1) < 2
+            ]
+            with Locations(inside, (10, 0)) as pushed:
+                Box(0.5, 0.5, 0.5)
+        self.assertEqual(len(inside), 12)
+        self.assertEqual(len(pushed.local_locations), 13)
+        self.assertTupleAlmostEquals(
+            pushed.local_locations[-1].position.to_tuple(), (10, 0, 0), 7
+        )
+        self.assertEqual(len(test.solids()), 26)
+
+    def test_nesting_composition(self):
+        outer = [Location((1, 2, 3), (10, 20, 30)), Location((-4, 0, 1), (0, 90, 45))]
+        inner = [Location((0, 0, 1), (45, 0, 0)), Location((2, 1, 0), (0, 0, 15))]
+        with Locations(*outer):
+            nested = Locations(*inner).local_locations
+        expected = [o * i for o in outer for i in inner]
+        self.assertEqual(len(nested), len(expected))
+        for location, expected_location in zip(nested, expected):
+            self.assertTupleAlmostEquals(
+                location.position.to_tuple(), expected_location.position.to_tuple(), 5
+            )
+            self.assertTupleAlmostEquals(
+                location.orientation.to_tuple(),
+                expected_location.orientation.to_tuple(),
+                5,
+            )
+
     def test_from_face(self):
         square = Face.make_rect(1, 1, Plane.XZ)
         with BuildPart():
@@ -103,6 +103,21 @@ class TestBuildPart(unittest.TestCase):
         self.assertEqual(len(test.solids()), 2)
         self.assertEqual(len(test.solids(Select.LAST)), 1)
 
+    def test_select_last(self):
+        """Test last_vertices, last_edges, last_faces and last_solids"""
+        with BuildPart() as test:
+            Box(2, 2, 2)
+            Cylinder(0.5, 2, mode=Mode.SUBTRACT)
+            # the hole and the modified top and bottom faces
+            self.assertEqual(len(test.last_faces), 3)
+            self.assertIs(test.last_faces, test.last_faces)
+            self.assertEqual(len(test.last_edges), 3)
+            self.assertEqual(len(test.last_vertices), 2)
+            self.assertEqual(len(test.last_solids), 1)
+            last_faces = test.last_faces
+            Box(1, 1, 4, mode=Mode.SUBTRACT)
+            self.assertIsNot(test.last_faces, last_faces)
+
     def test_mode_add_multiple(self):
         with BuildPart() as test:
             with PolarLocations(30, 5):
@@ -165,6 +180,38 @@ class TestBuildPart(unittest.TestCase):
                 Box(1, 1, 1)
         self.assertAlmostEqual(test.part.volume, 2, 5)
 
+    def test_instanced_locations(self):
+        with BuildPart() as test:
+            with GridLocations(2, 2, 3, 3):
+                holes = Cylinder(0.5, 1, mode=Mode.PRIVATE)
+        solids = holes.solids()
+        self.assertEqual(len(solids), 9)
+        self.assertTrue(all(s.wrapped.IsPartner(solids[0].wrapped) for s in solids))
+        self.assertEqual(len(set(s.location.to_tuple() for s in solids)), 9)
+
+    def test_deferred_booleans(self):
+        def build(deferred: bool) -> BuildPart:
+            with BuildPart(deferred_booleans=deferred) as test:
+                Box(10, 10, 1)
+                for x in range(-3, 4, 2):
+                    with Locations((x, 0, 0)):
+                        Cylinder(0.5, 1, mode=Mode.SUBTRACT)
+                with Locations((0, 0, 1)):
+                    Box(2, 2, 1)
+                top_faces = test.faces(Select.LAST)
+            return test, top_faces
+
+        immediate, immediate_faces = build(False)
+        deferred, deferred_faces = build(True)
+        self.assertAlmostEqual(immediate.part.volume, deferred.part.volume, 5)
+        self.assertEqual(len(immediate_faces), len(deferred_faces))
+        self.assertEqual(len(deferred.part.faces()), len(immediate.part.faces()))
+
+    def test_deferred_subtract_from_nothing(self):
+        with BuildPart(deferred_booleans=True):
+            with self.assertRaises(RuntimeError):
+                Box(1, 1, 1, mode=Mode.SUBTRACT)
+
 
 class TestBuildPartExceptions(unittest.TestCase):
     """Test exception handling"""
@@ -311,6 +358,80 @@ class TestLoft(unittest.TestCase):
         self.assertGreater(test.part.volume, 25 * pi * 30, 5)
 
 
+class TestObjectCache(unittest.TestCase):
+    def test_cached_objects(self):
+        cache = ObjectCache(max_size=2)
+        CachedBox = cache(Box)
+        with BuildPart() as test:
+            first = CachedBox(2, 2, 1, align=(Align.MIN, Align.MIN, Align.MIN))
+            with Locations((5, 0, 0)):
+                second = CachedBox(2, 2, 1, align=(Align.MIN, Align.MIN, Align.MIN))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+        self.assertIsInstance(second, Box)
+        self.assertEqual(second.box_height, 1)
+        self.assertTrue(first.solids()[0].wrapped.IsPartner(second.solids()[0].wrapped))
+        second_center = second.solids()[0].center().to_tuple()
+        self.assertTupleAlmostEquals(second_center, (6, 1, 0.5), 5)
+        self.assertAlmostEqual(test.part.volume, 8, 5)
+
+        # different arguments are built and the oldest entries evicted
+        with BuildPart():
+            CachedBox(1, 1, 1)
+            CachedBox(1, 1, 2)
+        self.assertEqual((cache.misses, len(cache)), (3, 2))
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_cached_object_attributes(self):
+        class Plate(BasePartObject):
+            def __init__(self, size: float, mode: Mode = Mode.ADD):
+                super().__init__(Solid.make_box(size, size, 1), mode=mode)
+                self.holes = [(0, 0)]
+                RigidJoint("top", self, Location((0, 0, 1)))
+
+        CachedPlate = ObjectCache()(Plate)
+        self.assertEqual(CachedPlate.__qualname__, Plate.__qualname__)
+        self.assertEqual(CachedPlate.__module__, Plate.__module__)
+        with BuildPart():
+            first = CachedPlate(2)
+            with Locations((5, 0, 0)):
+                second = CachedPlate(2)
+        self.assertEqual(second.holes, [(0, 0)])
+        second.holes.append((1, 1))
+        self.assertEqual(first.holes, [(0, 0)])
+        self.assertIs(second.joints["top"].parent, second)
+        self.assertIs(first.joints["top"].parent, first)
+
+    def test_cached_holes(self):
+        CachedHole = ObjectCache()(Hole)
+        with BuildPart():
+            Box(10, 10, 10)
+            CachedHole(1, depth=2)
+            with self.assertRaises(ValueError):
+                CachedHole(1)
+
+    def test_cached_builder_validation(self):
+        CachedBox = ObjectCache()(Box)
+        with BuildPart():
+            CachedBox(1, 1, 1)
+            with BuildSketch():
+                Circle(1)
+                with self.assertRaises(RuntimeError):
+                    CachedBox(1, 1, 1)
+        with self.assertRaises(RuntimeError):
+            CachedBox(1, 1, 1)
+
+    def test_cached_sketch_objects(self):
+        CachedRectangle = ObjectCache()(Rectangle)
+        with BuildSketch() as test:
+            CachedRectangle(1, 2, align=(Align.MIN, Align.MIN))
+            with Locations((5, 5)):
+                CachedRectangle(1, 2, align=(Align.MIN, Align.MIN))
+        centers = [face.center().to_tuple() for face in test.faces()]
+        self.assertEqual(len(centers), 2)
+        self.assertTupleAlmostEquals(centers[1], (5.5, 6, 0), 5)
+
+
 class TestRevolve(unittest.TestCase):
     def test_simple_revolve(self):
         with BuildPart() as test:
@@ -373,7 +373,7 @@ class TestBuildSketchObjects(unittest.TestCase):
             with Locations((10, 0)):
                 Circle(7)
             MakeHull(*test.edges())
-        self.assertAlmostEqual(test.sketch.area, 577.8808, 4)
+        self.assertAlmostEqual(test.sketch.area, 577.8809, 4)
         with self.assertRaises(ValueError):
             with BuildSketch():
                 MakeHull()
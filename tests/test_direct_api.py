@@ -1,13 +1,22 @@
 # system modules
 import copy
+import io
 import math
 import os
+import pickle
 import random
 import re
+import struct
+import tempfile
 from typing import Optional
 import unittest
+from unittest.mock import patch
+import weakref
+import zipfile
 from random import uniform
 
+import numpy as np
+from OCP.BRep import BRep_Tool
 from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
 from OCP.gp import (
     gp,
@@ -23,6 +32,7 @@ from OCP.gp import (
     gp_Vec,
     gp_XYZ,
 )
+from OCP.TopLoc import TopLoc_Location
 
 from build123d.build_common import GridLocations, Locations, PolarLocations
 from build123d.build_enums import (
@@ -32,6 +42,7 @@ from build123d.build_enums import (
     Kind,
     PositionMode,
     SortBy,
+    Unit,
     Until,
 )
 from build123d.build_part import Box, BuildPart, Extrude
@@ -41,6 +52,7 @@ from build123d.geometry import (
     BoundBox,
     Color,
     Location,
+    LocationArray,
     Matrix,
     Rotation,
     Vector,
@@ -60,6 +72,7 @@ from build123d.topology import (
     Shape,
     Shell,
     Solid,
+    TessellationCache,
     Vertex,
     Wire,
     edges_to_wires,
@@ -180,6 +193,63 @@ class TestAssembly(unittest.TestCase):
         overlap, pair, distance = assembly.do_children_intersect()
         self.assertTrue(overlap)
 
+    def test_intersecting_children(self):
+        spheres = [Solid.make_sphere(1).locate(Location((x, 0, 0))) for x in range(4)]
+        spheres.append(Solid.make_sphere(1).locate(Location((0, 10, 0))))
+        assembly = Compound(label="assembly", children=spheres)
+        pairs = assembly.intersecting_children()
+        self.assertEqual(
+            [(spheres.index(a), spheres.index(b)) for a, b, _ in pairs],
+            [(0, 1), (1, 2), (2, 3)],
+        )
+        for _, _, volume in pairs:
+            self.assertAlmostEqual(volume, 5 * math.pi / 12, 3)
+        overlap, pair, volume = assembly.do_children_intersect()
+        self.assertTrue(overlap)
+        self.assertEqual(pair, pairs[0][:2])
+        self.assertEqual(Compound(children=spheres[-1:]).intersecting_children(), [])
+
+    def test_pickle(self):
+        assembly = TestAssembly.create_test_assembly()
+        assembly.locate(Location((0, 0, 5), (0, 0, 45)))
+        box = assembly.children[0]
+        RigidJoint("top", box, Location((0, 0, 1)))
+        RigidJoint("base", assembly)
+
+        assembly_copy = pickle.loads(pickle.dumps(assembly))
+        self.assertEqual(assembly_copy.label, "assembly")
+        self.assertEqual([c.label for c in assembly_copy.children], ["box", "sphere"])
+        self.assertIs(assembly_copy.children[0].parent, assembly_copy)
+        self.assertAlmostEqual(assembly_copy.location.position.Z, 5, 5)
+        self.assertAlmostEqual(assembly_copy.location.orientation.Z, 45, 5)
+        self.assertAlmostEqual(assembly_copy.volume, assembly.volume, 5)
+
+        box_copy = assembly_copy.children[0]
+        joint = box_copy.joints["top"]
+        self.assertIs(joint.parent, box_copy)
+        self.assertAlmostEqual(
+            joint.relative_location.position.Z,
+            box.joints["top"].relative_location.position.Z,
+            5,
+        )
+        self.assertIs(assembly_copy.joints["base"].parent, assembly_copy)
+
+        # nested assemblies store each leaf once and share it with their children
+        child = Solid.make_sphere(1)
+        child.label = "leaf"
+        nested = Compound(label="nested", children=[child])
+        top = Compound(label="top", children=[nested, Solid.make_box(1, 1, 1)])
+        leaves = [Solid.make_sphere(1), Solid.make_box(1, 1, 1)]
+        self.assertLess(len(pickle.dumps(top)), 1.2 * len(pickle.dumps(leaves)))
+        leaf_copy = pickle.loads(pickle.dumps(child))
+        top_copy = leaf_copy.parent.parent
+        self.assertEqual(top_copy.label, "top")
+        self.assertEqual(len(top_copy.solids()), 2)
+        for child in [leaf_copy, top_copy.children[1]]:
+            self.assertTrue(
+                any(child.wrapped.IsPartner(s.wrapped) for s in top_copy.solids())
+            )
+
 
 class TestAxis(DirectApiTestCase):
     """Test the Axis class"""
@@ -202,6 +272,11 @@ class TestAxis(DirectApiTestCase):
         self.assertVectorAlmostEquals(x_copy.position, (0, 0, 0), 5)
         self.assertVectorAlmostEquals(x_copy.direction, (1, 0, 0), 5)
 
+    def test_axis_pickle(self):
+        axis = pickle.loads(pickle.dumps(Axis((1, 2, 3), (0, 1, 0))))
+        self.assertVectorAlmostEquals(axis.position, (1, 2, 3), 7)
+        self.assertVectorAlmostEquals(axis.direction, (0, 1, 0), 7)
+
     def test_axis_to_location(self):
         # TODO: Verify this is correct
         x_location = Axis.X.to_location()
@@ -611,6 +686,11 @@ class TestColor(unittest.TestCase):
         self.assertEqual(c.to_tuple()[2], 1.0)
         self.assertEqual(c.to_tuple()[3], 0.5)
 
+    def test_pickle(self):
+        c = pickle.loads(pickle.dumps(Color(0.1, 0.2, 0.3, 0.4)))
+        for value, expected in zip(c.to_tuple(), (0.1, 0.2, 0.3, 0.4)):
+            self.assertAlmostEqual(value, expected, 5)
+
 
 class TestCompound(DirectApiTestCase):
     def test_make_text(self):
@@ -973,6 +1053,60 @@ class TestFace(DirectApiTestCase):
         self.assertAlmostEqual(imported_torus.area, torus.area, 0)
         os.remove("test_torus.stl")
 
+    def test_export_stl_stream(self):
+        box = Solid.make_box(1, 2, 3)
+        stl_data = io.BytesIO()
+        self.assertTrue(box.export_stl(stl_data))
+        data = stl_data.getvalue()
+        (triangle_count,) = struct.unpack("<I", data[80:84])
+        self.assertEqual(triangle_count, 12)
+        self.assertEqual(len(data), 84 + 50 * triangle_count)
+
+        # outward facing triangles enclose the box volume
+        triangles = np.frombuffer(
+            data[84:],
+            dtype=[("normal", "<f4", (3,)), ("corners", "<f4", (3, 3)), ("", "<u2")],
+        )
+        normals, corners = triangles["normal"], triangles["corners"]
+        volume = np.einsum(
+            "ij,ij", corners[:, 0], np.cross(corners[:, 1], corners[:, 2])
+        )
+        self.assertAlmostEqual(volume / 6, 6, 4)
+        self.assertAlmostEqual(np.abs(normals).sum(axis=1).max(), 1, 5)
+
+        box.export_stl("test_box.stl")
+        self.assertEqual(os.path.getsize("test_box.stl"), len(data))
+        os.remove("test_box.stl")
+
+        with self.assertRaises(ValueError):
+            box.export_stl(io.BytesIO(), ascii_format=True)
+
+        # a shape meshed with other tolerances is exported at the requested ones
+        # without replacing its mesh
+        sphere = Solid.make_sphere(1)
+        fine, coarse, fine_again = io.BytesIO(), io.BytesIO(), io.BytesIO()
+        sphere.export_stl(fine, 0.1, angular_tolerance=0.1)
+        face = sphere.faces()[0].wrapped
+        poly = BRep_Tool.Triangulation_s(face, TopLoc_Location())
+        sphere.export_stl(coarse, 0.1, angular_tolerance=1)
+        self.assertGreater(len(fine.getvalue()), len(coarse.getvalue()))
+        kept = BRep_Tool.Triangulation_s(face, TopLoc_Location())
+        self.assertEqual(kept.NbTriangles(), poly.NbTriangles())
+        self.assertEqual(kept.Parameters().Angle(), 0.1)
+        sphere.export_stl(fine_again, 0.1, angular_tolerance=0.1)
+        self.assertEqual(fine.getvalue(), fine_again.getvalue())
+
+    def test_export_3mf(self):
+        Solid.make_box(1, 2, 3).export_3mf("test_box.3mf", 1e-3, 0.1, Unit.MILLIMETER)
+        with zipfile.ZipFile("test_box.3mf") as archive:
+            model = archive.read("3D/3dmodel.model")
+        os.remove("test_box.3mf")
+        self.assertTrue(model.startswith(b"<?xml"))
+        # the faces share the box corners
+        self.assertEqual(model.count(b"<vertex "), 8)
+        self.assertEqual(model.count(b"<triangle "), 12)
+        self.assertIn(b'<item objectid="1" />', model)
+
     def test_is_coplanar(self):
         square = Face.make_rect(1, 1, plane=Plane.XZ)
         self.assertTrue(square.is_coplanar(Plane.XZ))
@@ -1012,6 +1146,32 @@ class TestImportExport(unittest.TestCase):
         with self.assertRaises(ValueError):
             step_box = import_step("test_box.step")
 
+    def test_binary_brep(self):
+        box = Solid.make_box(1, 1, 1).cut(Solid.make_cylinder(0.25, 1))
+        volume = box.volume
+        box.mesh(0.1)
+        box.export_brep("test_box.brep", binary=True)
+        self.assertAlmostEqual(import_brep("test_box.brep").volume, volume, 5)
+        brep_box = import_brep("test_box.brep", binary=True)
+        self.assertAlmostEqual(brep_box.volume, volume, 5)
+        os.remove("test_box.brep")
+
+        sizes = {}
+        for binary in [False, True]:
+            for triangulation in [False, True]:
+                brep_data = io.BytesIO()
+                box.export_brep(brep_data, binary, triangulation)
+                sizes[(binary, triangulation)] = len(brep_data.getvalue())
+                brep_data.seek(0)
+                brep_box = import_brep(brep_data)
+                self.assertAlmostEqual(brep_box.volume, volume, 5)
+                mesh = BRep_Tool.Triangulation_s(
+                    brep_box.faces()[0].wrapped, TopLoc_Location()
+                )
+                self.assertEqual(mesh is not None, triangulation)
+        self.assertLess(sizes[(True, False)], sizes[(True, True)])
+        self.assertLess(sizes[(False, False)], sizes[(False, True)])
+
 
 class TestJoints(DirectApiTestCase):
     def test_rigid_joint(self):
@@ -1398,12 +1558,71 @@ class TestLocation(DirectApiTestCase):
         self.assertVectorAlmostEquals(loc1.position, loc3.position.to_tuple(), 6)
         self.assertVectorAlmostEquals(loc1.orientation, loc3.orientation.to_tuple(), 6)
 
+    def test_pickle(self):
+        loc = pickle.loads(pickle.dumps(Location((1, 2, 3), (90, 45, 22.5))))
+        self.assertVectorAlmostEquals(loc.position, (1, 2, 3), 6)
+        self.assertVectorAlmostEquals(loc.orientation, (90, 45, 22.5), 6)
+
+        rotation = pickle.loads(pickle.dumps(Rotation(10, 20, 30)))
+        self.assertIsInstance(rotation, Rotation)
+        self.assertEqual((rotation.about_x, rotation.about_y), (10, 20))
+        self.assertVectorAlmostEquals(rotation.orientation, (10, 20, 30), 6)
+
     def test_to_axis(self):
         axis = Location((1, 2, 3), (-90, 0, 0)).to_axis()
         self.assertVectorAlmostEquals(axis.position, (1, 2, 3), 6)
         self.assertVectorAlmostEquals(axis.direction, (0, 1, 0), 6)
 
 
+class TestLocationArray(DirectApiTestCase):
+    def test_access(self):
+        locations = [Location((i, 0, 0), (0, 0, 10 * i)) for i in range(5)]
+        array = LocationArray(locations)
+        self.assertEqual(len(array), 5)
+        self.assertIsInstance(array[2], Location)
+        self.assertVectorAlmostEquals(array[2].position, (2, 0, 0), 7)
+        self.assertVectorAlmostEquals(array[-1].orientation, (0, 0, 40), 7)
+        self.assertEqual(len(array[1:3]), 2)
+        self.assertVectorAlmostEquals(array[1:3][0].position, (1, 0, 0), 7)
+        odd = array[array.positions[:, 0] % 2 == 1]
+        self.assertEqual([loc.position.X for loc in odd], [1, 3])
+        self.assertEqual(len(list(array)), 5)
+        self.assertEqual(len(LocationArray()), 0)
+        copied = LocationArray(array)
+        copied.matrices[0, 0, 3] = 10
+        self.assertVectorAlmostEquals(array[0].position, (0, 0, 0), 7)
+        with self.assertRaises(ValueError):
+            LocationArray(np.zeros((2, 3, 4)))
+
+    def test_from_positions(self):
+        array = LocationArray.from_positions([(1, 2, 3), (4, 5, 6)])
+        self.assertVectorAlmostEquals(array[1].position, (4, 5, 6), 7)
+        self.assertVectorAlmostEquals(array[1].orientation, (0, 0, 0), 7)
+
+    def test_composition(self):
+        left = [Location((1, 2, 3), (10, 20, 30)), Location((0, 1, 0), (90, 0, 0))]
+        right = [Location((3, 0, 1), (0, 45, 0)), Location((0, 0, 2), (0, 0, 60))]
+        expected = [a * b for a in left for b in right]
+        outer = LocationArray(left).outer(LocationArray(right))
+        self.assertEqual(len(outer), 4)
+        for location, expected_location in zip(outer, expected):
+            self.assertVectorAlmostEquals(
+                location.position, expected_location.position, 6
+            )
+            self.assertVectorAlmostEquals(
+                location.orientation, expected_location.orientation, 6
+            )
+
+        pairwise = LocationArray(left) * LocationArray(right)
+        self.assertVectorAlmostEquals(
+            pairwise[1].position, (left[1] * right[1]).position, 6
+        )
+        moved = left[0] * LocationArray(right)
+        self.assertVectorAlmostEquals(moved[1].position, expected[1].position, 6)
+        moved = LocationArray(left) * right[0]
+        self.assertVectorAlmostEquals(moved[1].position, expected[2].position, 6)
+
+
 class TestMatrix(DirectApiTestCase):
     def test_matrix_creation_and_access(self):
         def matrix_vals(m):
@@ -1664,6 +1883,61 @@ class TestMixin1D(DirectApiTestCase):
     #     self.assertVectorAlmostEquals(shadow.center(), (0, 0, 0), 5)
     #     self.assertAlmostEqual(shadow.area, math.pi, 5)
 
+    def test_evaluate(self):
+        edges = [
+            Edge.make_line((1, 2, 3), (4, -1, 2)),
+            Edge.make_circle(3, Plane.XZ.offset(2), 30, 200),
+            Edge.make_spline([(0, 0), (1, 2), (3, 1)]),
+        ]
+        for edge in edges:
+            curve = edge._geom_adaptor()
+            params = np.linspace(curve.FirstParameter(), curve.LastParameter(), 7)
+            points = edge._evaluate(params)
+            self.assertEqual(points.shape, (7, 3))
+            for param, point in zip(params, points):
+                self.assertVectorAlmostEquals(
+                    edge.position_at(param, PositionMode.PARAMETER), tuple(point), 7
+                )
+
+    def test_sample(self):
+        edges = [
+            Edge.make_line((1, 2, 3), (4, -1, 2)),
+            Edge.make_circle(3, Plane.XZ.offset(2), 30, 200),
+            Wire.make_helix(2, 6, 1),
+        ]
+        distances = np.linspace(0, 1, 9)
+        for edge in edges:
+            positions, tangents, frames = edge.sample(distances)
+            self.assertEqual(positions.shape, (9, 3))
+            self.assertEqual(tangents.shape, (9, 3))
+            self.assertEqual(frames.shape, (9, 3, 3))
+            for distance, position, tangent in zip(distances, positions, tangents):
+                self.assertVectorAlmostEquals(
+                    edge.position_at(distance), tuple(position), 5
+                )
+                self.assertVectorAlmostEquals(
+                    edge.tangent_at(distance), tuple(tangent), 5
+                )
+        helix = edges[-1]
+        for distance, location in zip(distances, helix.locations(distances)):
+            expected = helix.location_at(distance)
+            self.assertVectorAlmostEquals(location.position, expected.position, 5)
+            self.assertVectorAlmostEquals(
+                location.orientation, expected.orientation, 2
+            )
+
+        # Small batches don't build an arc length table, large ones interpolate one
+        spline = Edge.make_spline([(0, 0), (1, 1), (2, 0), (3, 2)])
+        spline.positions([0.1, 0.5])
+        cache = Shape.property_cache
+        self.assertFalse(cache.contains(spline.wrapped, "arc_length_table"))
+        many = np.linspace(-0.1, 1.1, 101)
+        for position, distance in zip(spline.positions(many), many):
+            self.assertVectorAlmostEquals(position, spline.position_at(distance), 4)
+        self.assertTrue(cache.contains(spline.wrapped, "arc_length_table"))
+        table = spline._arc_length_table()
+        self.assertIs(spline._arc_length_table(), table)
+
 
 class TestMixin3D(DirectApiTestCase):
     """Test that 3D add ins"""
@@ -1933,6 +2207,10 @@ class TestPlane(DirectApiTestCase):
             Plane(origin=(0, 0, 0), x_dir=(1, 0, 0), z_dir=(0, 1, 1)),
         )
 
+    def test_plane_pickle(self):
+        plane = Plane(origin=(1, 2, 3), x_dir=(1, 0, 0), z_dir=(0, 1, 1))
+        self.assertEqual(pickle.loads(pickle.dumps(plane)), plane)
+
     def test_plane_not_equal(self):
         # type difference
         for value in [None, 0, 1, "abc"]:
@@ -2145,6 +2423,152 @@ class TestShape(DirectApiTestCase):
         self.assertEqual(len(verts), 24)
         self.assertEqual(len(triangles), 12)
 
+    def test_tessellate_arrays(self):
+        box123 = Solid.make_box(1, 2, 3).locate(Location((1, 2, 3)))
+        verts, triangles = box123.tessellate_arrays(1e-6)
+        self.assertEqual(verts.shape, (24, 3))
+        self.assertEqual(verts.dtype, np.float64)
+        self.assertEqual(triangles.shape, (12, 3))
+        self.assertEqual(triangles.dtype, np.int32)
+        self.assertTrue(np.allclose(verts.min(axis=0), (1, 2, 3)))
+        self.assertTrue(np.allclose(verts.max(axis=0), (2, 4, 6)))
+
+        vector_verts, tuple_triangles = box123.tessellate(1e-6)
+        self.assertTrue(np.allclose(verts, [v.to_tuple() for v in vector_verts]))
+        self.assertEqual(triangles.tolist(), [list(t) for t in tuple_triangles])
+
+    def test_tessellate_weld(self):
+        box = Solid.make_box(1, 2, 3)
+        verts, triangles = box.tessellate_arrays(1e-6, weld_tolerance=1e-6)
+        self.assertEqual(verts.shape, (8, 3))
+        self.assertEqual(triangles.shape, (12, 3))
+        # every edge of a watertight mesh is shared by exactly two triangles
+        edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        self.assertTrue(np.all(counts == 2))
+
+        # triangles collapsed by a coarse weld are removed
+        verts, triangles = box.tessellate_arrays(1e-6, weld_tolerance=1.5)
+        self.assertLess(len(triangles), 12)
+        self.assertTrue(np.all(triangles < len(verts)))
+
+        with self.assertRaises(ValueError):
+            box.tessellate(1e-6, weld_tolerance=0)
+
+        # close vertices on either side of a tolerance sized cell edge are merged
+        verts, triangles = Shape._weld_vertices(
+            np.array([[0, 0, 0], [-1e-12, 0, 0], [1, 0, 0], [0, 1 + 3e-7, 0]]),
+            np.array([[0, 2, 3], [1, 2, 3]]),
+            1e-6,
+        )
+        self.assertEqual(verts.shape, (3, 3))
+        self.assertEqual(triangles.tolist(), [[0, 1, 2], [0, 1, 2]])
+
+        # inexact coordinates of a rotated and translated box
+        box = box.moved(Location((0.1, 0.2, 0.3), (17, 23, 31)))
+        verts, triangles = box.tessellate_arrays(1e-6, weld_tolerance=1e-6)
+        self.assertEqual(verts.shape, (8, 3))
+
+    def test_geometry_digest(self):
+        box = Solid.make_box(1, 2, 3)
+        digest = box.geometry_digest()
+        self.assertEqual(len(digest), 64)
+        self.assertEqual(Solid.make_box(1, 2, 3).geometry_digest(), digest)
+        box.mesh(1e-3)
+        self.assertEqual(box.geometry_digest(), digest)
+        self.assertEqual(copy.deepcopy(box).geometry_digest(), digest)
+
+        self.assertNotEqual(Solid.make_box(1, 2, 3.1).geometry_digest(), digest)
+        self.assertEqual(Solid.make_box(1, 2, 3 + 1e-9).geometry_digest(), digest)
+        self.assertNotEqual(
+            Solid.make_box(1, 2, 3 + 1e-9).geometry_digest(precision=12), digest
+        )
+
+        moved_box = box.moved(Location((1, 0, 0)))
+        self.assertNotEqual(moved_box.geometry_digest(), digest)
+        self.assertEqual(
+            moved_box.geometry_digest(include_location=False),
+            box.geometry_digest(include_location=False),
+        )
+
+        # sharing TShapes doesn't change the digest
+        instances = Compound.make_compound(
+            [box.moved_ref(Location((2 * i, 0, 0))) for i in range(3)]
+        )
+        self.assertEqual(
+            instances.geometry_digest(), copy.deepcopy(instances).geometry_digest()
+        )
+        self.assertNotEqual(
+            instances.geometry_digest(),
+            Compound.make_compound(list(instances)[:2]).geometry_digest(),
+        )
+        cylinder = Solid.make_cylinder(1, 2)
+        self.assertNotEqual(
+            cylinder.geometry_digest(), Solid.make_cone(1, 0.5, 2).geometry_digest()
+        )
+
+        # curves through the same points with different shapes
+        spline = Edge.make_spline([(0, 0), (1, 1), (2, 0)])
+        steep = Edge.make_spline([(0, 0), (1, 1), (2, 0)], tangents=[(1, 3), (1, -3)])
+        self.assertNotEqual(spline.geometry_digest(), steep.geometry_digest())
+        self.assertEqual(
+            spline.geometry_digest(),
+            Edge.make_spline([(0, 0), (1, 1), (2, 0)]).geometry_digest(),
+        )
+        self.assertNotEqual(
+            Edge.make_ellipse(2, 1).geometry_digest(),
+            Edge.make_ellipse(2, 1.5).geometry_digest(),
+        )
+
+    def test_tessellation_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TessellationCache(cache_dir)
+            Shape.tessellation_cache = cache
+            try:
+                box = Solid.make_box(1, 2, 3)
+                verts, triangles = box.tessellate_arrays(1e-3)
+                self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+                # an identical shape built separately is found in the cache
+                same_box = Solid.make_box(1, 2, 3)
+                cached_verts, cached_triangles = same_box.tessellate_arrays(1e-3)
+                self.assertEqual(cache.hits, 1)
+                self.assertTrue(np.array_equal(verts, cached_verts))
+                self.assertTrue(np.array_equal(triangles, cached_triangles))
+                key = cache.key(box, 1e-3, 0.1)
+                self.assertTrue(np.array_equal(cache.get(key)[0], verts))
+                self.assertIsNone(cache.get(cache.key(box, 1e-3, 0.2)))
+
+                # different tolerances or locations have their own entries
+                box.tessellate_arrays(1e-4)
+                box.moved(Location((1, 0, 0))).tessellate_arrays(1e-3)
+                self.assertEqual((cache.misses, len(cache)), (4, 3))
+
+                stl_data = io.BytesIO()
+                box.export_stl(stl_data)
+                self.assertEqual(cache.hits, 3)
+                self.assertEqual(len(stl_data.getvalue()), 84 + 50 * 12)
+
+                cache.max_size = cache.size - 1
+                box.tessellate_arrays(1e-2)
+                self.assertLess(cache.size, cache.max_size)
+
+                cache.clear()
+                self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+            finally:
+                Shape.tessellation_cache = None
+
+    def test_tessellate_parallel(self):
+        spheres = [Solid.make_sphere(1).locate(Location((3 * i, 0, 0))) for i in range(4)]
+        serial_verts, serial_triangles = Compound.make_compound(
+            spheres
+        ).tessellate_arrays(1e-3)
+        parallel_verts, parallel_triangles = Compound.make_compound(
+            [copy.deepcopy(s) for s in spheres]
+        ).tessellate_arrays(1e-3, parallel=True)
+        self.assertEqual(serial_verts.shape, parallel_verts.shape)
+        self.assertEqual(serial_triangles.shape, parallel_triangles.shape)
+
     # def test_to_vtk_poly_data(self):
 
     #     from vtkmodules.vtkCommonDataModel import vtkPolyData
@@ -2176,6 +2600,173 @@ class TestShape(DirectApiTestCase):
         with self.assertWarns(DeprecationWarning):
             Solid.make_box(1, 1, 1).copy()
 
+    def test_shallow_copy(self):
+        box = Solid.make_box(1, 1, 1)
+        box.label = "box"
+        box_ref = copy.copy(box).move(Location((2, 0, 0)))
+        self.assertTrue(box_ref.wrapped.IsPartner(box.wrapped))
+        self.assertEqual(box_ref.label, "box")
+        self.assertVectorAlmostEquals(box.position, (0, 0, 0), 5)
+        self.assertVectorAlmostEquals(box_ref.position, (2, 0, 0), 5)
+
+    def test_entities_hash_collisions(self):
+        box = Solid.make_box(1, 1, 1)
+        instances = Compound.make_compound(
+            [copy.copy(box).move(Location((2 * i, 0, 0))) for i in range(4)]
+        )
+        # Give every shape the same hash code so only IsSame removes duplicates
+        with patch("build123d.topology.HASH_CODE_MAX", 1):
+            self.assertEqual(len(instances.solids()), 4)
+            self.assertEqual(len(instances.edges()), 48)
+            self.assertEqual(len(box.edges()), 12)
+
+    def test_pickle(self):
+        box = Solid.make_box(1, 2, 3).locate(Location((1, 2, 3), (10, 20, 30)))
+        box.label = "box"
+        box.color = Color("red")
+        box.cache_topology = True
+        box.faces()
+        box_copy = pickle.loads(pickle.dumps(box))
+        self.assertIsInstance(box_copy, Solid)
+        self.assertEqual(box_copy.label, "box")
+        self.assertEqual(box_copy.color.to_tuple(), Color("red").to_tuple())
+        self.assertAlmostEqual(box_copy.volume, 6, 5)
+        self.assertEqual(len(box_copy.faces()), 6)
+        self.assertVectorAlmostEquals(box_copy.position, (1, 2, 3), 5)
+        self.assertVectorAlmostEquals(box_copy.orientation, (10, 20, 30), 5)
+
+        empty = pickle.loads(pickle.dumps(Compound(label="empty")))
+        self.assertIsNone(empty.wrapped)
+        self.assertEqual(empty.label, "empty")
+
+    def test_cache_topology(self):
+        box = Solid.make_box(1, 1, 1)
+        self.assertFalse(box.cache_topology)
+        box.cache_topology = True
+        self.assertTrue(box.cache_topology)
+        self.assertEqual(len(box.faces()), 6)
+        self.assertEqual(len(box.edges()), 12)
+        self.assertEqual(len(box.faces()), 6)
+        self.assertEqual(len(box._entities_from("Edge", "Face")), 12)
+        self.assertEqual(len(box._topology_index.entities), 2)
+
+        # changing the location of the shape invalidates the cache
+        box.locate(Location((10, 0, 0)))
+        self.assertAlmostEqual(box.faces().sort_by(Axis.X)[0].center().X, 10, 5)
+        box.wrapped = Solid.make_box(2, 2, 2).wrapped
+        self.assertAlmostEqual(box.faces().sort_by(Axis.X)[-1].center().X, 2, 5)
+
+        # copies start with an empty cache
+        box_copy = box.moved(Location((0, 0, 1)))
+        self.assertTrue(box_copy.cache_topology)
+        self.assertEqual(len(box_copy._topology_index.entities), 0)
+
+        box.cache_topology = False
+        self.assertIsNone(box._topology_index)
+
+        # modifying a shared TShape in place invalidates the cache
+        compound = Compound.make_compound(
+            [Solid.make_box(1, 1, 1), Solid.make_sphere(1)]
+        )
+        compound.cache_topology = True
+        self.assertEqual(len(compound.solids()), 2)
+        compound_ref = compound.moved_ref(Location((5, 0, 0)))
+        compound_ref._remove(compound_ref.solids()[0])
+        self.assertEqual(len(compound.solids()), 1)
+
+        with BuildPart() as test:
+            Box(1, 1, 1)
+        self.assertFalse(test.part.cache_topology)
+
+    def test_property_cache(self):
+        Shape.property_cache.clear()
+        box = Solid.make_box(1, 2, 3)
+        self.assertAlmostEqual(box.volume, 6, 5)
+        self.assertEqual(Shape.property_cache.misses, 1)
+        self.assertVectorAlmostEquals(box.center(), (0.5, 1, 1.5), 5)
+        self.assertEqual(Shape.property_cache.hits, 1)
+
+        # a reference at a new location has its own entry
+        moved_box = box.moved_ref(Location((1, 0, 0)))
+        self.assertVectorAlmostEquals(moved_box.center(), (1.5, 1, 1.5), 5)
+        self.assertEqual(Shape.property_cache.misses, 2)
+
+        # changing the location in place isn't confused with the old entry
+        box.locate(Location((0, 0, 1)))
+        self.assertVectorAlmostEquals(box.center(), (0.5, 1, 2.5), 5)
+        self.assertEqual(Shape.property_cache.misses, 3)
+
+        bbox = box.bounding_box()
+        bbox.min.X = 10
+        self.assertAlmostEqual(box.bounding_box().min.X, 0, 5)
+
+        Shape.property_cache.invalidate(box)
+        self.assertEqual(len(Shape.property_cache), 0)
+
+        # cached shapes are released
+        wrapped = weakref.ref(moved_box.wrapped)
+        del moved_box
+        self.assertIsNone(wrapped())
+        self.assertEqual(len(Shape.property_cache), 0)
+        box.volume
+        self.assertEqual(len(Shape.property_cache), 1)
+        del box
+        self.assertEqual(len(Shape.property_cache), 0)
+
+        # the cache can be disabled
+        Shape.property_cache.max_size = 0
+        try:
+            self.assertAlmostEqual(Solid.make_box(1, 1, 1).volume, 1, 5)
+            self.assertEqual(len(Shape.property_cache), 0)
+        finally:
+            Shape.property_cache.max_size = 512
+
+    def test_conservative_bounding_box(self):
+        sphere = Solid.make_sphere(1)
+        exact = sphere.bounding_box()
+        fast = sphere.bounding_box(optimal=False)
+        self.assertAlmostEqual(exact.size.X, 2, 5)
+        for fast_min, exact_min in zip(fast.min, exact.min):
+            self.assertLessEqual(fast_min, exact_min)
+        for fast_max, exact_max in zip(fast.max, exact.max):
+            self.assertGreaterEqual(fast_max, exact_max)
+
+    def test_moved_located_ref(self):
+        box = Solid.make_box(1, 1, 1)
+        box.color = Color(1, 0, 0)
+        RigidJoint("top", box, Location((0, 0, 1)))
+        moved_box = box.moved_ref(Location((2, 0, 0)))
+        located_box = box.located_ref(Location((0, 2, 0)))
+        for box_ref in [moved_box, located_box]:
+            self.assertTrue(box_ref.wrapped.IsPartner(box.wrapped))
+            self.assertFalse(box_ref.wrapped.IsSame(box.wrapped))
+            self.assertEqual(box_ref.color.to_tuple(), (1, 0, 0, 0))
+            self.assertIs(box_ref.joints["top"].parent, box_ref)
+        self.assertVectorAlmostEquals(box.position, (0, 0, 0), 5)
+        self.assertVectorAlmostEquals(moved_box.position, (2, 0, 0), 5)
+        self.assertVectorAlmostEquals(located_box.position, (0, 2, 0), 5)
+
+        child = Solid.make_box(1, 1, 1)
+        assembly = Compound(label="assembly", children=[child])
+        moved_assembly = assembly.moved_ref(Location((0, 0, 2)))
+        self.assertEqual(len(moved_assembly.children), 1)
+        self.assertTrue(moved_assembly.children[0].wrapped.IsPartner(child.wrapped))
+
+    def test_moved_located_copy(self):
+        box = Solid.make_box(1, 1, 1)
+        for box_copy in [
+            box.moved(Location((2, 0, 0))),
+            box.located(Location((0, 2, 0))),
+            box.translate((0, 0, 2)),
+            box.transform_geometry(Matrix([[1, 0, 0, 2], [0, 1, 0, 0], [0, 0, 1, 0]])),
+        ]:
+            self.assertFalse(box_copy.wrapped.IsPartner(box.wrapped))
+
+        compound = Compound.make_compound([box, Solid.make_sphere(1)])
+        compound_copy = compound.moved(Location((2, 0, 0)))
+        compound_copy._remove(compound_copy.solids()[0])
+        self.assertEqual(len(compound.solids()), 2)
+
     def test_distance_to_with_closest_points(self):
         s0 = Solid.make_sphere(1).locate(Location((0, 2.1, 0)))
         s1 = Solid.make_sphere(1)
@@ -2232,6 +2823,28 @@ class TestShapeList(DirectApiTestCase):
         with self.assertRaises(ValueError):
             Solid.make_box(1, 1, 1).faces().filter_by("True")
 
+    def test_filter_by_position(self):
+        faces = Solid.make_box(1, 2, 3).faces()
+        self.assertEqual(len(faces.filter_by_position(Axis.Z, 0, 3)), 6)
+        self.assertEqual(
+            len(faces.filter_by_position(Axis.Z, 0, 3, inclusive=(False, False))), 4
+        )
+        top = faces.filter_by_position(Axis.Z, 1.5, 3, inclusive=(False, True))
+        self.assertEqual(len(top), 1)
+        self.assertVectorAlmostEquals(top[0].center(), (0.5, 1, 3), 5)
+
+        # positions along an offset and tilted axis match local coordinates
+        axis = Axis((1, 2, 3), (1, -1, 2))
+        edges = Solid.make_cone(2, 1, 2).edges()
+        positions = [axis.to_plane().to_local_coords(e).center().Z for e in edges]
+        self.assertEqual(
+            [id(e) for e in edges.sort_by(axis)],
+            [id(e) for _, e in sorted(zip(positions, edges), key=lambda p: p[0])],
+        )
+        lowest = min(positions)
+        selected = edges.filter_by_position(axis, lowest - 1e-6, lowest + 1e-6)
+        self.assertEqual(len(selected), 1)
+
     def test_first_last(self):
         vertices = (
             Solid.make_box(1, 1, 1).vertices().sort_by(Axis((0, 0, 0), (1, 1, 1)))
@@ -2538,6 +3151,9 @@ class TestVector(DirectApiTestCase):
         self.assertVectorAlmostEquals(v2, (1, 2, 3), 7)
         self.assertVectorAlmostEquals(v3, (1, 2, 3), 7)
 
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(Vector(1, 2, 3))), Vector(1, 2, 3))
+
 
 class VertexTests(DirectApiTestCase):
     """Test the extensions to the cadquery Vertex class"""
@@ -2617,6 +3233,26 @@ class TestWire(unittest.TestCase):
         ellipse = half_ellipse1.stitch(half_ellipse2)
         self.assertEqual(len(ellipse.wires()), 1)
 
+    def test_make_wire_sequenced(self):
+        points = [(math.cos(a), math.sin(a)) for a in np.linspace(0, math.pi, 21)]
+        edges = [Edge.make_line(*pair) for pair in zip(points, points[1:])]
+        # Reverse some edges and start the shuffled list in the middle of the chain
+        edges = [
+            Edge.make_line(e.end_point(), e.start_point()) if i % 3 else e
+            for i, e in enumerate(edges)
+        ]
+        gapped = edges[:10] + edges[11:]
+        random.Random(1).shuffle(edges)
+        wire = Wire.make_wire(edges, sequenced=True)
+        self.assertEqual(len(wire.edges()), 20)
+        self.assertAlmostEqual(wire.length, sum(e.length for e in edges), 5)
+        self.assertFalse(wire.is_closed())
+
+        random.Random(1).shuffle(gapped)
+        with self.assertRaises(ValueError) as error:
+            Wire.make_wire(gapped, sequenced=True)
+        self.assertIn("gap of 0.156", str(error.exception))
+
     def test_fillet_2d(self):
         square = Wire.make_rect(1, 1)
         squaroid = square.fillet_2d(0.1, square.vertices())
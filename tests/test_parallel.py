@@ -0,0 +1,69 @@
+"""
+
+build123d parallel tests
+
+name: test_parallel.py
+date: October 17th 2026
+
+desc: Unit tests for the build123d parallel module
+
+license:
+
+    Copyright 2022 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+import unittest
+from build123d import *
+from build123d.parallel import build_parts
+from build123d.topology import Shape
+
+
+def drilled_block(size: float, color: str) -> BuildPart:
+    """Build function run in the worker processes"""
+    with BuildPart() as block:
+        Box(size, size, size)
+        Hole(size / 4)
+    block.part.label = f"block {size}"
+    block.part.color = Color(color)
+    RigidJoint("top", block.part, Location((0, 0, size / 2)))
+    return block
+
+
+class TestBuildParts(unittest.TestCase):
+    def test_build_parts(self):
+        blocks = build_parts(drilled_block, [1, 2], ["red", "blue"], max_workers=2)
+        self.assertEqual([block.label for block in blocks], ["block 1", "block 2"])
+        self.assertEqual(blocks[1].color.to_tuple(), Color("blue").to_tuple())
+        with BuildPart() as local_block:
+            Box(2, 2, 2)
+            Hole(0.5)
+        self.assertAlmostEqual(blocks[1].volume, local_block.part.volume, 5)
+
+        joint = blocks[1].joints["top"]
+        self.assertIs(joint.parent, blocks[1])
+        self.assertAlmostEqual(joint.relative_location.position.Z, 1, 5)
+
+    def test_shape_arguments(self):
+        # shapes are also transported to the build function
+        sizes = build_parts(_bounding_box_size, [Solid.make_box(1, 2, 3)])
+        self.assertAlmostEqual(sizes[0].Z, 3, 5)
+
+
+def _bounding_box_size(shape: Shape) -> Vector:
+    return shape.bounding_box().size
+
+
+if __name__ == "__main__":
+    unittest.main()